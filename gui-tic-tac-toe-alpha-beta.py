@@ -2,6 +2,8 @@ import pygame
 import sys
 import random
 
+from tictactoe import minimax as search
+
 pygame.init()
 
 WIDTH, HEIGHT = 600, 600
@@ -59,38 +61,9 @@ def available_moves(board):
 
 
 def minimax(board, depth, maximizing_player, nodes_visited, alpha, beta):
-    winner = check_winner(board)
-    if winner:
-        return 1 if winner == 'X' else -1
-    elif is_board_full(board):
-        return 0
-
-    nodes_visited[0] += 1
-
-    if maximizing_player:
-        max_eval = float('-inf')
-        for move in available_moves(board):
-            i, j = move
-            board[i][j] = 'X'
-            eval = minimax(board, depth + 1, False, nodes_visited, alpha, beta)
-            board[i][j] = ' '
-            max_eval = max(max_eval, eval)
-            alpha = max(alpha, eval)
-            if beta <= alpha:
-                break
-        return max_eval
-    else:
-        min_eval = float('inf')
-        for move in available_moves(board):
-            i, j = move
-            board[i][j] = 'O'
-            eval = minimax(board, depth + 1, True, nodes_visited, alpha, beta)
-            board[i][j] = ' '
-            min_eval = min(min_eval, eval)
-            beta = min(beta, eval)
-            if beta <= alpha:
-                break
-        return min_eval
+    # Alpha-beta with a transposition table shared across moves and games;
+    # positions answered by the table are not counted as visited.
+    return search(board, maximizing_player, nodes_visited, alpha, beta)
 
 
 def best_move(board, depth_limit, nodes_visited):
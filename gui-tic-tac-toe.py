@@ -2,6 +2,8 @@ import pygame
 import sys
 import random
 
+from tictactoe import minimax as search
+
 pygame.init()
 
 WIDTH, HEIGHT = 600, 600
@@ -59,33 +61,10 @@ def available_moves(board):
 
 
 def minimax(board, depth, maximizing_player, nodes_visited):
-    winner = check_winner(board)
-    if winner:
-        return 1 if winner == 'X' else -1
-    elif is_board_full(board):
-        return 0
-
-    nodes_visited[0] += 1
-    #print(f"At depth {depth}, Nodes Visited: {nodes_visited[0]}")
-
-    if maximizing_player:
-        max_eval = float('-inf')
-        for move in available_moves(board):
-            i, j = move
-            board[i][j] = 'X'
-            eval = minimax(board, depth + 1, False, nodes_visited)
-            board[i][j] = ' '
-            max_eval = max(max_eval, eval)
-        return max_eval
-    else:
-        min_eval = float('inf')
-        for move in available_moves(board):
-            i, j = move
-            board[i][j] = 'O'
-            eval = minimax(board, depth + 1, True, nodes_visited)
-            board[i][j] = ' '
-            min_eval = min(min_eval, eval)
-        return min_eval
+    # Full minimax, with exact values shared across moves and games through
+    # a transposition table; positions answered by the table are not counted
+    # as visited.
+    return search(board, maximizing_player, nodes_visited, pruning=False)
 
 
 def best_move(board, depth_limit, nodes_visited):
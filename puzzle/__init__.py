@@ -0,0 +1,49 @@
+from puzzle.anytime import anytime_astar, iter_anytime
+from puzzle.bidirectional import bidirectional_astar, bidirectional_bfs
+from puzzle.cache import SolveCache
+from puzzle.heuristics import HEURISTICS, get_heuristic, register_heuristic
+from puzzle.ida import ida_star
+from puzzle.methods import METHODS, solve
+from puzzle.moves import MovePath, apply_moves
+from puzzle.solvability import is_solvable
+from puzzle.solver import solve_8_puzzle
+from puzzle.state import (
+    PackedState,
+    canonical_goal,
+    format_board,
+    geometry,
+    neighbors,
+    pack,
+    parse_board,
+    slide,
+    tile_at,
+    unpack,
+)
+
+__all__ = [
+    "HEURISTICS",
+    "METHODS",
+    "MovePath",
+    "PackedState",
+    "SolveCache",
+    "anytime_astar",
+    "apply_moves",
+    "bidirectional_astar",
+    "bidirectional_bfs",
+    "canonical_goal",
+    "format_board",
+    "geometry",
+    "get_heuristic",
+    "ida_star",
+    "is_solvable",
+    "iter_anytime",
+    "neighbors",
+    "pack",
+    "parse_board",
+    "register_heuristic",
+    "slide",
+    "solve",
+    "solve_8_puzzle",
+    "tile_at",
+    "unpack",
+]
@@ -0,0 +1,167 @@
+"""Anytime repairing A* (ARA*).
+
+A first solution comes from weighted A* with a large weight, which is cheap.
+The weight is then lowered step by step, reusing the previous search instead
+of starting over: states whose cost improved after they were expanded are
+kept aside and returned to the open list for the next round. Every solution
+comes with a bound on how far it can be from optimal, and the search stops
+at the deadline or once the bound reaches 1 (the solution is optimal).
+"""
+import heapq
+import time
+from collections import namedtuple
+from itertools import count
+
+from puzzle.heuristics import get_heuristic
+from puzzle.moves import MovePath
+from puzzle.solvability import is_solvable
+from puzzle.state import neighbors, pack
+from puzzle.stats import SearchStats
+
+AnytimeSolution = namedtuple("AnytimeSolution", "path nodes_removed bound weight")
+
+# Expansions between two looks at the clock.
+_CLOCK_INTERVAL = 64
+
+
+def iter_anytime(initial_state, goal_state, heuristic="manhattan", time_limit=None,
+                 weight=3.0, weight_step=0.5, stats=None, on_expand=None):
+    """Yield an ``AnytimeSolution`` for each improved path.
+
+    The first solution is always produced, however long it takes; after that
+    the search stops once ``time_limit`` seconds have passed since the call,
+    or when a solution is proven optimal (``bound == 1``). ``bound`` is the
+    proven suboptimality factor: the path is at most ``bound`` times longer
+    than the shortest one. ``nodes_removed`` is cumulative.
+
+    Counters are accumulated into ``stats`` (a ``SearchStats``) if given;
+    ``on_expand`` is as for ``solve_8_puzzle``.
+    """
+    initial, goal = pack(initial_state), pack(goal_state)
+    if not is_solvable(initial, goal):
+        return
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    stats = SearchStats() if stats is None else stats
+    heuristic = get_heuristic(heuristic, goal)
+    update_heuristic = stats.timed(heuristic.update)
+    goal_code = goal.code
+
+    costs = {initial.code: 0}
+    estimates = {initial.code: stats.timed(heuristic)(initial)}
+    parents = {initial.code: None}
+    open_states = {initial.code: initial}
+    closed = set()
+    expanded = set()
+    inconsistent = {}
+    tiebreak = count(0, -1)
+    nodes_removed = generated = 0
+    best_cost = None
+
+    def record():
+        stats.nodes_generated = generated
+        stats.nodes_expanded = nodes_removed
+        stats.nodes_reopened = nodes_removed - len(expanded)
+        stats.peak_visited = len(costs)
+
+    while True:
+        heap = [
+            (costs[code] + weight * estimates[code], estimates[code], next(tiebreak), code, state)
+            for code, state in open_states.items()
+        ]
+        heapq.heapify(heap)
+
+        # Expand until no open state could lead to a better weighted path.
+        timed_out = False
+        while heap:
+            f, _, _, code, state = heap[0]
+            if code not in open_states or f != costs[code] + weight * estimates[code]:
+                heapq.heappop(heap)
+                continue
+            if goal_code in costs and costs[goal_code] <= f:
+                break
+            if best_cost is not None and deadline is not None and nodes_removed % _CLOCK_INTERVAL == 0:
+                if time.perf_counter() >= deadline:
+                    timed_out = True
+                    break
+            if len(open_states) > stats.peak_frontier:
+                stats.peak_frontier = len(open_states)
+            heapq.heappop(heap)
+            del open_states[code]
+            closed.add(code)
+            expanded.add(code)
+            nodes_removed += 1
+
+            cost = costs[code] + 1
+            h = estimates[code]
+            if on_expand is not None:
+                on_expand(state, cost - 1, h)
+            children = neighbors(state)
+            generated += len(children)
+            for neighbor_state in children:
+                neighbor_code = neighbor_state.code
+                if cost >= costs.get(neighbor_code, cost + 1):
+                    continue
+                costs[neighbor_code] = cost
+                parents[neighbor_code] = state
+                if neighbor_code not in estimates:
+                    estimates[neighbor_code] = update_heuristic(h, state, neighbor_state)
+                if neighbor_code in closed:
+                    inconsistent[neighbor_code] = neighbor_state
+                else:
+                    open_states[neighbor_code] = neighbor_state
+                    neighbor_h = estimates[neighbor_code]
+                    heapq.heappush(heap, (cost + weight * neighbor_h, neighbor_h, next(tiebreak), neighbor_code, neighbor_state))
+
+        record()
+        if timed_out or goal_code not in costs:
+            return
+
+        # Nothing outside the expanded region can be cheaper than this.
+        lower = min(
+            (costs[code] + estimates[code] for code in (*open_states, *inconsistent)),
+            default=costs[goal_code],
+        )
+        bound = min(weight, costs[goal_code] / lower) if lower else 1
+        if best_cost is None or costs[goal_code] < best_cost or bound == 1:
+            best_cost = costs[goal_code]
+            yield AnytimeSolution(_path(parents, goal), nodes_removed, max(bound, 1), weight)
+        if bound <= 1 or (deadline is not None and time.perf_counter() >= deadline):
+            return
+
+        weight = max(1, weight - weight_step)
+        open_states.update(inconsistent)
+        inconsistent.clear()
+        closed.clear()
+
+
+def anytime_astar(initial_state, goal_state, heuristic="manhattan", time_limit=None,
+                  weight=3.0, weight_step=0.5, on_solution=None, on_expand=None, profile=False):
+    """Best path found within ``time_limit`` seconds by ARA*.
+
+    Without a time limit the search runs until the path is proven optimal.
+
+    Returns ``(path, stats)`` like ``solve_8_puzzle``.
+    ``on_solution(solution)`` is called with each ``AnytimeSolution`` as it is
+    found, e.g. to log the bound.
+    """
+    path = None
+    stats = SearchStats()
+    with stats.measure(profile):
+        solutions = iter_anytime(
+            initial_state, goal_state, heuristic, time_limit, weight, weight_step, stats, on_expand
+        )
+        for solution in solutions:
+            if on_solution is not None:
+                on_solution(solution)
+            path = solution.path
+    return path, stats
+
+
+def _path(parents, goal):
+    states = []
+    state = goal
+    while state is not None:
+        states.append(state)
+        state = parents[state.code]
+    states.reverse()
+    return MovePath.from_states(states)
@@ -0,0 +1,143 @@
+"""Solve many (initial, goal) pairs in parallel.
+
+``solve_batch`` fans the pairs out over a process pool and yields a
+``BatchResult`` for each one as soon as it finishes, so results arrive in
+completion order rather than input order. Only a bounded number of pairs is
+in flight at once, so arbitrarily long inputs can be streamed through it::
+
+    python -m puzzle.batch pairs.txt --workers 8 --method astar
+
+A pairs file holds one instance per line in any format understood by
+``puzzle.instances``, e.g. ``"123405786 123456780"``.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from puzzle.heuristics import HEURISTICS
+from puzzle.methods import METHODS, solve
+from puzzle.instances import read_instances
+from puzzle.stats import SearchStats
+
+BatchResult = namedtuple(
+    "BatchResult", "index initial_state goal_state path nodes_removed steps time_taken stats error",
+    defaults=(None,),
+)
+
+
+# Result caches of this process, by file and options.
+_CACHES = {}
+
+
+def _cache(path, options):
+    key = (path, repr(sorted(options.items())))
+    if key not in _CACHES:
+        from puzzle.cache import SolveCache
+        _CACHES[key] = SolveCache(path=path, **options)
+    return _CACHES[key]
+
+
+def solve_pair(index, initial_state, goal_state, options, cache=None):
+    start_time = time.perf_counter()
+    try:
+        if cache is None:
+            path, stats = solve(initial_state, goal_state, **options)
+        else:
+            path, stats = _cache(cache, options).solve(initial_state, goal_state)
+    except ValueError as error:
+        return _failed(index, error, initial_state, goal_state, time.perf_counter() - start_time)
+    time_taken = time.perf_counter() - start_time
+    steps = len(path) if path is not None else None
+    return BatchResult(index, initial_state, goal_state, path, stats.nodes_removed, steps, time_taken, stats)
+
+
+def _failed(index, error, initial_state=None, goal_state=None, time_taken=0.0):
+    return BatchResult(index, initial_state, goal_state, None, 0, None, time_taken, SearchStats(), str(error))
+
+
+def solve_batch(pairs, workers=None, max_pending=None, cache=None, **options):
+    """Yield a ``BatchResult`` per ``(initial_state, goal_state)`` pair as it completes.
+
+    ``options`` are passed to ``puzzle.solve`` (``method``, ``heuristic``, ...).
+    ``workers`` defaults to every core; ``workers=1`` solves in this process.
+    At most ``max_pending`` pairs (default four per worker) are queued at once.
+    ``cache`` names a SQLite file of solutions shared by all workers (see
+    ``puzzle.cache``); repeated and symmetric pairs are then solved once.
+    A pair the solver rejects with ``ValueError``, such as boards of
+    different sizes, yields a result with the message in ``error``, and so
+    does a ``ValueError`` given in place of a pair (see ``read_pairs``).
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for index, pair in enumerate(pairs):
+            if isinstance(pair, ValueError):
+                yield _failed(index, pair)
+            else:
+                yield solve_pair(index, *pair, options, cache)
+        return
+
+    max_pending = max_pending or workers * 4
+    pairs = enumerate(pairs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    index, pair = next(pairs)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if isinstance(pair, ValueError):
+                    yield _failed(index, pair)
+                    continue
+                pending.add(executor.submit(solve_pair, index, *pair, options, cache))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def read_pairs(path):
+    """Yield ``(initial_state, goal_state)`` boards from a pairs file.
+
+    A malformed line yields its ``ValueError`` instead, which ``solve_batch``
+    turns into an error result.
+    """
+    with open(path) as file:
+        for instance in read_instances(file, path, errors=True):
+            if isinstance(instance, ValueError):
+                yield instance
+            else:
+                yield instance[1:]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a file of 8-puzzle pairs in parallel.")
+    parser.add_argument("pairs", help="file with one 'initial goal' pair per line")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--method", choices=sorted(METHODS), default="astar")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="manhattan")
+    parser.add_argument("--cache", help="SQLite file of solutions reused across runs")
+    args = parser.parse_args(argv)
+
+    results = solve_batch(
+        read_pairs(args.pairs), workers=args.workers, cache=args.cache,
+        method=args.method, heuristic=args.heuristic,
+    )
+    for result in results:
+        if result.error is not None:
+            print(f"{result.index}\terror\t{result.error}", flush=True)
+            continue
+        steps = "unsolved" if result.steps is None else result.steps
+        moves = "-" if result.path is None else result.path.moves or "-"
+        print(f"{result.index}\t{steps}\t{result.nodes_removed}\t{result.time_taken:.6f}\t{moves}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""Reproducible benchmarks for the 8-puzzle solvers.
+
+``run`` draws seeded random instances at exact optimal depths (the distance
+table of the goal lists every state at each depth), solves each with every
+method and heuristic, and writes the measurements as JSON::
+
+    python -m puzzle.bench run -o baseline.json
+    python -m puzzle.bench run -o current.json --depths 10,20 --per-depth 5
+    python -m puzzle.bench compare baseline.json current.json
+
+Each result records the wall time (best of ``--repeat`` runs), nodes
+expanded and generated, the peak memory allocated by the search (measured
+by ``tracemalloc`` in a separate run, as tracing slows the search down) and
+the effective branching factor b* solving N + 1 = 1 + b* + ... + b*^d for N
+generated nodes at depth d. ``compare`` matches groups by method, heuristic
+and depth and exits with status 1 if any got slower or expanded more nodes
+than the tolerances allow. Nothing here reads stdin or opens a window.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from puzzle.heuristics import HEURISTICS, get_heuristic
+from puzzle.methods import METHODS, solve
+from puzzle.state import CANONICAL_GOAL, format_board, unpack
+from puzzle.storage import goal_argument
+
+FORMAT = 1
+DEFAULT_DEPTHS = (4, 8, 12, 16, 20)
+# Methods that take no heuristic run once per instance.
+UNGUIDED = ("bfs", "bidirectional_bfs", "table")
+# Methods whose paths may be longer than the optimal depth.
+APPROXIMATE = ("beam",)
+
+
+def make_instances(depths=DEFAULT_DEPTHS, per_depth=3, seed=0, goal=CANONICAL_GOAL):
+    """Return ``(depth, initial_board)`` pairs drawn uniformly at each optimal depth."""
+    from puzzle.table import load, unrank
+
+    table = load(goal)
+    rng = random.Random(seed)
+    instances = []
+    for depth in depths:
+        ranks = table.states_at(depth)
+        if not ranks:
+            raise ValueError(f"no state is {depth} moves from {format_board(unpack(goal))}")
+        for index in rng.sample(ranks, min(per_depth, len(ranks))):
+            instances.append((depth, unpack(unrank(index))))
+    return instances
+
+
+def configurations(methods=None, heuristics=None):
+    """``(method, heuristic)`` pairs to benchmark, every combination by default."""
+    heuristics = sorted(HEURISTICS) if heuristics is None else heuristics
+    for method in sorted(METHODS) if methods is None else methods:
+        if method in UNGUIDED:
+            yield method, None
+        else:
+            for heuristic in heuristics:
+                yield method, heuristic
+
+
+def effective_branching_factor(generated, depth):
+    """b* with 1 + b* + ... + b*^depth == generated + 1, by bisection."""
+    if depth <= 0 or generated <= 0:
+        return None
+    target = generated + 1
+    low, high = 0.0, float(max(generated, 2))
+    for _ in range(100):
+        middle = (low + high) / 2
+        total = sum(middle ** power for power in range(depth + 1))
+        if total < target:
+            low = middle
+        else:
+            high = middle
+    return round((low + high) / 2, 4)
+
+
+def measure(initial_state, goal_state, method, heuristic, repeat=1, memory=True):
+    options = {"method": method}
+    if heuristic is not None:
+        options["heuristic"] = heuristic
+    best_time = None
+    for _ in range(repeat):
+        path, stats = solve(initial_state, goal_state, **options)
+        if best_time is None or stats.wall_time < best_time:
+            best_time = stats.wall_time
+    peak_memory = None
+    if memory:
+        tracemalloc.start()
+        try:
+            solve(initial_state, goal_state, **options)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return path, stats, best_time, peak_memory
+
+
+def run(instances, goal=CANONICAL_GOAL, methods=None, heuristics=None, repeat=1, memory=True, progress=None):
+    """Benchmark every configuration on ``instances``; returns the result document."""
+    goal_state = unpack(goal)
+    results = []
+    for method, heuristic in configurations(methods, heuristics):
+        if heuristic is not None:
+            # Build lookup tables and pattern databases before the clock starts.
+            get_heuristic(heuristic, goal)
+        for index, (depth, initial_state) in enumerate(instances):
+            path, stats, wall_time, peak_memory = measure(
+                initial_state, goal_state, method, heuristic, repeat, memory
+            )
+            steps = None if path is None else len(path)
+            if steps != depth and not (method in APPROXIMATE and steps is not None):
+                raise RuntimeError(
+                    f"{method}/{heuristic} solved {format_board(initial_state)} in {steps} moves, "
+                    f"expected {depth}"
+                )
+            results.append({
+                "method": method,
+                "heuristic": heuristic,
+                "depth": depth,
+                "instance": index,
+                "initial": format_board(initial_state),
+                "steps": steps,
+                "time": wall_time,
+                "expanded": stats.nodes_expanded,
+                "generated": stats.nodes_generated,
+                "peak_memory": peak_memory,
+                "ebf": effective_branching_factor(stats.nodes_generated, depth),
+            })
+            if progress is not None:
+                progress(results[-1])
+    return {
+        "format": FORMAT,
+        "meta": {
+            "goal": format_board(goal_state),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "max_rss_kb": _max_rss(),
+        },
+        "results": results,
+        "summary": summarize(results),
+    }
+
+
+def summarize(results):
+    """Median figures per (method, heuristic, depth) group."""
+    groups = {}
+    for result in results:
+        groups.setdefault((result["method"], result["heuristic"], result["depth"]), []).append(result)
+    summary = []
+    for (method, heuristic, depth), group in sorted(groups.items(), key=lambda item: _sort_key(item[0])):
+        memory = [result["peak_memory"] for result in group if result["peak_memory"] is not None]
+        ebf = [result["ebf"] for result in group if result["ebf"] is not None]
+        summary.append({
+            "method": method,
+            "heuristic": heuristic,
+            "depth": depth,
+            "instances": len(group),
+            "time": statistics.median(result["time"] for result in group),
+            "expanded": statistics.median(result["expanded"] for result in group),
+            "peak_memory": max(memory) if memory else None,
+            "ebf": round(statistics.median(ebf), 4) if ebf else None,
+        })
+    return summary
+
+
+def compare(baseline, current, time_tolerance=0.25, nodes_tolerance=0.0, time_floor=0.001):
+    """Return ``(lines, regressions)`` comparing two result documents' summaries.
+
+    A group regresses when its median time grew by more than
+    ``time_tolerance`` (relative) and ``time_floor`` seconds, so that timer
+    noise on tiny solves is ignored, or its median expansions grew by more
+    than ``nodes_tolerance`` (relative).
+    """
+    old = {_group_key(entry): entry for entry in baseline["summary"]}
+    lines = []
+    regressions = 0
+    for entry in current["summary"]:
+        key = _group_key(entry)
+        label = f"{entry['method']}/{entry['heuristic'] or '-'} depth {entry['depth']}"
+        previous = old.pop(key, None)
+        if previous is None:
+            lines.append(f"new        {label}")
+            continue
+        problems = []
+        slower = entry["time"] - previous["time"]
+        if entry["time"] > previous["time"] * (1 + time_tolerance) and slower > time_floor:
+            problems.append(f"time {previous['time']:.6f}s -> {entry['time']:.6f}s")
+        if entry["expanded"] > previous["expanded"] * (1 + nodes_tolerance):
+            problems.append(f"expanded {previous['expanded']} -> {entry['expanded']}")
+        if problems:
+            regressions += 1
+            lines.append(f"REGRESSION {label}: {', '.join(problems)}")
+        else:
+            lines.append(f"ok         {label}: {_ratio(entry['time'], previous['time'])} time")
+    for entry in old.values():
+        lines.append(f"missing    {entry['method']}/{entry['heuristic'] or '-'} depth {entry['depth']}")
+    return lines, regressions
+
+
+def _ratio(new, old):
+    return f"x{new / old:.2f}" if old else "n/a"
+
+
+def _group_key(entry):
+    return entry["method"], entry["heuristic"], entry["depth"]
+
+
+def _sort_key(key):
+    method, heuristic, depth = key
+    return method, heuristic or "", depth
+
+
+def _max_rss():
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _int_list(text):
+    try:
+        return [int(value) for value in text.split(",") if value]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got {text!r}") from None
+
+
+def _name_list(choices):
+    def parse(text):
+        names = [name for name in text.split(",") if name]
+        unknown = sorted(set(names) - set(choices))
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown {', '.join(unknown)}; expected {', '.join(sorted(choices))}")
+        return names
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the 8-puzzle solvers.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark and write JSON results")
+    run_parser.add_argument("-o", "--output", default="-", help="result file (default: stdout)")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--depths", type=_int_list, default=list(DEFAULT_DEPTHS),
+                            help="optimal depths to sample, e.g. 4,8,12 (default: %(default)s)")
+    run_parser.add_argument("--per-depth", type=int, default=3, help="instances per depth (default: 3)")
+    run_parser.add_argument("--goal", type=goal_argument("benchmarks use 8-puzzle distance tables"),
+                            default=CANONICAL_GOAL)
+    run_parser.add_argument("--methods", type=_name_list(METHODS), help="comma-separated methods (default: all)")
+    run_parser.add_argument("--heuristics", type=_name_list(HEURISTICS),
+                            help="comma-separated heuristics (default: all)")
+    run_parser.add_argument("--repeat", type=int, default=1, help="timed runs per solve, best is kept")
+    run_parser.add_argument("--no-memory", dest="memory", action="store_false",
+                            help="skip the tracemalloc run")
+    run_parser.add_argument("--quiet", action="store_true", help="no progress on stderr")
+
+    compare_parser = commands.add_parser("compare", help="compare results against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--time-tolerance", type=float, default=0.25,
+                                help="allowed relative slowdown of median time (default: 0.25)")
+    compare_parser.add_argument("--nodes-tolerance", type=float, default=0.0,
+                                help="allowed relative growth of median expansions (default: 0)")
+    compare_parser.add_argument("--time-floor", type=float, default=0.001,
+                                help="slowdowns below this many seconds are noise (default: 0.001)")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        with open(args.current) as file:
+            current = json.load(file)
+        lines, regressions = compare(
+            baseline, current, args.time_tolerance, args.nodes_tolerance, args.time_floor
+        )
+        print("\n".join(lines))
+        print(f"{regressions} regression(s)")
+        return 1 if regressions else 0
+
+    def progress(result):
+        print(
+            f"{result['method']}/{result['heuristic'] or '-'} depth {result['depth']} "
+            f"#{result['instance']}: {result['time']:.6f}s, {result['expanded']} expanded",
+            file=sys.stderr,
+        )
+
+    instances = make_instances(args.depths, args.per_depth, args.seed, args.goal)
+    document = run(
+        instances, args.goal, args.methods, args.heuristics, args.repeat, args.memory,
+        None if args.quiet else progress,
+    )
+    document["meta"].update(seed=args.seed, depths=args.depths, per_depth=args.per_depth)
+    if args.output == "-":
+        json.dump(document, sys.stdout, indent=1)
+        print()
+    else:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w") as file:
+            json.dump(document, file, indent=1)
+            file.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
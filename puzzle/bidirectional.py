@@ -0,0 +1,187 @@
+import heapq
+from itertools import count
+
+from puzzle.heuristics import get_heuristic
+from puzzle.moves import MovePath
+from puzzle.solvability import is_solvable
+from puzzle.state import neighbors, pack
+from puzzle.stats import SearchStats
+
+
+def bidirectional_astar(initial_state, goal_state, heuristic="manhattan", on_expand=None, profile=False):
+    """Front-to-end bidirectional A* between ``initial_state`` and ``goal_state``.
+
+    The forward search is guided by ``heuristic`` towards the goal and the
+    backward search by the same heuristic towards the initial state. The
+    search stops once the best meeting cost found is no larger than the
+    smallest f on either frontier, which keeps the result optimal for
+    consistent heuristics. Returns ``(path, stats)`` like
+    ``solve_8_puzzle``; ``on_expand`` is called for expansions on both sides.
+    """
+    initial, goal = pack(initial_state), pack(goal_state)
+    stats = SearchStats()
+    with stats.measure(profile):
+        if not is_solvable(initial, goal):
+            return None, stats
+        if initial == goal:
+            stats.nodes_expanded = stats.peak_visited = 1
+            return MovePath(initial), stats
+        path = _astar(initial, goal, heuristic, stats, on_expand)
+    return path, stats
+
+
+def _astar(initial, goal, heuristic, stats, on_expand):
+    tiebreak = count(0, -1)
+    forward = _Side(initial, get_heuristic(heuristic, goal), next(tiebreak), stats)
+    backward = _Side(goal, get_heuristic(heuristic, initial), next(tiebreak), stats)
+
+    best_cost = float("inf")
+    meeting = None
+    generated = reopened = peak_frontier = 0
+
+    while forward.frontier and backward.frontier:
+        forward.discard_stale()
+        backward.discard_stale()
+        if not forward.frontier or not backward.frontier:
+            break
+        if best_cost <= max(forward.frontier[0][0], backward.frontier[0][0]):
+            break
+
+        size = len(forward.frontier) + len(backward.frontier)
+        if size > peak_frontier:
+            peak_frontier = size
+        side, other = (forward, backward) if len(forward.frontier) <= len(backward.frontier) else (backward, forward)
+        _, h, _, cost, state = heapq.heappop(side.frontier)
+        if state.code in side.expanded:
+            reopened += 1
+        else:
+            side.expanded.add(state.code)
+        if on_expand is not None:
+            on_expand(state, cost, h)
+
+        cost += 1
+        update = side.update
+        children = neighbors(state)
+        generated += len(children)
+        for neighbor_state in children:
+            code = neighbor_state.code
+            if cost >= side.costs.get(code, cost + 1):
+                continue
+            side.costs[code] = cost
+            side.parents[code] = state
+            neighbor_h = update(h, state, neighbor_state)
+            heapq.heappush(side.frontier, (cost + neighbor_h, neighbor_h, next(tiebreak), cost, neighbor_state))
+
+            other_cost = other.costs.get(code)
+            if other_cost is not None and cost + other_cost < best_cost:
+                best_cost = cost + other_cost
+                meeting = neighbor_state
+
+    stats.nodes_generated = generated
+    stats.nodes_expanded = len(forward.expanded) + len(backward.expanded) + reopened
+    stats.nodes_reopened = reopened
+    stats.peak_frontier = peak_frontier
+    stats.peak_visited = len(forward.costs) + len(backward.costs)
+    if meeting is None:
+        return None
+    return _join(meeting, forward.parents, backward.parents)
+
+
+def bidirectional_bfs(initial_state, goal_state, heuristic=None, on_expand=None, profile=False):
+    """Bidirectional breadth-first search; ``heuristic`` is accepted and ignored.
+
+    Whole layers are expanded from whichever side has the smaller frontier,
+    and the shortest meeting within the layer is kept, so the result is
+    optimal for unit-cost moves. ``on_expand`` receives ``h=0``.
+    """
+    initial, goal = pack(initial_state), pack(goal_state)
+    stats = SearchStats()
+    with stats.measure(profile):
+        if not is_solvable(initial, goal):
+            return None, stats
+        if initial == goal:
+            stats.nodes_expanded = stats.peak_visited = 1
+            return MovePath(initial), stats
+        path = _bfs(initial, goal, stats, on_expand)
+    return path, stats
+
+
+def _bfs(initial, goal, stats, on_expand):
+    parents = ({initial.code: None}, {goal.code: None})
+    depths = ({initial.code: 0}, {goal.code: 0})
+    layers = ([initial], [goal])
+    nodes_removed = generated = peak_frontier = 0
+    path = None
+
+    while layers[0] and layers[1]:
+        peak_frontier = max(peak_frontier, len(layers[0]) + len(layers[1]))
+        index = 0 if len(layers[0]) <= len(layers[1]) else 1
+        own_parents, other_parents = parents[index], parents[1 - index]
+        own_depths, other_depths = depths[index], depths[1 - index]
+        best_cost = float("inf")
+        meeting = None
+        next_layer = []
+
+        for state in layers[index]:
+            nodes_removed += 1
+            depth = own_depths[state.code] + 1
+            if on_expand is not None:
+                on_expand(state, depth - 1, 0)
+            children = neighbors(state)
+            generated += len(children)
+            for neighbor_state in children:
+                code = neighbor_state.code
+                if code in own_parents:
+                    continue
+                own_parents[code] = state
+                own_depths[code] = depth
+                next_layer.append(neighbor_state)
+                if code in other_parents and depth + other_depths[code] < best_cost:
+                    best_cost = depth + other_depths[code]
+                    meeting = neighbor_state
+
+        if meeting is not None:
+            path = _join(meeting, parents[0], parents[1])
+            break
+        layers = (next_layer, layers[1]) if index == 0 else (layers[0], next_layer)
+
+    stats.nodes_generated = generated
+    stats.nodes_expanded = nodes_removed
+    stats.peak_frontier = peak_frontier
+    stats.peak_visited = len(parents[0]) + len(parents[1])
+    return path
+
+
+class _Side:
+    __slots__ = ("update", "frontier", "costs", "parents", "expanded")
+
+    def __init__(self, start, heuristic, tiebreak, stats):
+        h = stats.timed(heuristic)(start)
+        self.update = stats.timed(heuristic.update)
+        # Entries are (f, h, tiebreak, cost, state).
+        self.frontier = [(h, h, tiebreak, 0, start)]
+        self.costs = {start.code: 0}
+        self.parents = {start.code: None}
+        self.expanded = set()
+
+    def discard_stale(self):
+        frontier, costs = self.frontier, self.costs
+        while frontier:
+            _, _, _, cost, state = frontier[0]
+            if cost <= costs[state.code]:
+                return
+            heapq.heappop(frontier)
+
+
+def _join(meeting, forward_parents, backward_parents):
+    states = []
+    state = meeting
+    while state is not None:
+        states.append(state)
+        state = forward_parents[state.code]
+    states.reverse()
+    state = backward_parents[meeting.code]
+    while state is not None:
+        states.append(state)
+        state = backward_parents[state.code]
+    return MovePath.from_states(states)
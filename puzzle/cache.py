@@ -0,0 +1,210 @@
+"""Memoized solving with symmetry reduction.
+
+``SolveCache`` wraps ``puzzle.solve`` for one configuration (method,
+heuristic, ...). Problems are reduced before lookup so that equivalent ones
+share an entry:
+
+* the tiles are renumbered so that the goal reads 1, 2, 3, ... around its
+  blank, which makes every goal with the blank on the same cell alike;
+* both boards are put through the 8 symmetries of the square (rotations and
+  reflections) and the smallest resulting key is kept.
+
+Entries hold the move string in the reduced frame; a hit maps the letters
+back through the inverse symmetry. The newest ``maxsize`` entries are kept
+in memory; with ``path`` they are also written to a SQLite file, which
+outlives the process and can be shared between processes.
+"""
+import sqlite3
+from collections import OrderedDict, namedtuple
+
+from puzzle.methods import solve
+from puzzle.moves import MovePath
+from puzzle.state import geometry, pack
+from puzzle.stats import SearchStats
+
+CacheInfo = namedtuple("CacheInfo", "hits stored_hits misses maxsize currsize")
+
+_VECTORS = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
+_LETTERS = {vector: move for move, vector in _VECTORS.items()}
+
+# The symmetries of the square as (row, col) -> (row, col) for width n; the
+# direction of a move transforms the same way with n = 1.
+_SYMMETRIES = (
+    lambda r, c, n: (r, c),
+    lambda r, c, n: (c, n - 1 - r),
+    lambda r, c, n: (n - 1 - r, n - 1 - c),
+    lambda r, c, n: (n - 1 - c, r),
+    lambda r, c, n: (r, n - 1 - c),
+    lambda r, c, n: (n - 1 - r, c),
+    lambda r, c, n: (c, r),
+    lambda r, c, n: (n - 1 - c, n - 1 - r),
+)
+
+# How each symmetry renames move letters.
+_MOVE_MAPS = tuple(
+    {move: _LETTERS[symmetry(dr, dc, 1)] for move, (dr, dc) in _VECTORS.items()}
+    for symmetry in _SYMMETRIES
+)
+_INVERSE_MOVE_MAPS = tuple({new: old for old, new in moves.items()} for moves in _MOVE_MAPS)
+
+_PERMUTATIONS = {}
+
+
+def _permutations(width):
+    """Destination cell of every cell under each symmetry."""
+    try:
+        return _PERMUTATIONS[width]
+    except KeyError:
+        pass
+    permutations = tuple(
+        tuple(
+            r * width + c
+            for r, c in (symmetry(*divmod(cell, width), width) for cell in range(width * width))
+        )
+        for symmetry in _SYMMETRIES
+    )
+    _PERMUTATIONS[width] = permutations
+    return permutations
+
+
+def _values(state, cells, bits, mask):
+    code = state.code
+    return [(code >> (cell * bits)) & mask for cell in range(cells)]
+
+
+def canonical_key(initial, goal):
+    """Return ``(key, symmetry)`` for packed ``initial`` and ``goal`` states.
+
+    Problems with equal keys have the same solutions up to renaming the moves
+    with ``_MOVE_MAPS[symmetry]``.
+    """
+    width, cells, bits, mask, _ = geometry(goal.width)
+    initial_values = _values(initial, cells, bits, mask)
+    goal_values = _values(goal, cells, bits, mask)
+    best = None
+    for index, permutation in enumerate(_permutations(width)):
+        moved_goal = [0] * cells
+        moved_initial = [0] * cells
+        for cell, target in enumerate(permutation):
+            moved_goal[target] = goal_values[cell]
+            moved_initial[target] = initial_values[cell]
+        # Renumber the tiles 1, 2, 3, ... in the order the goal lists them.
+        labels = {0: 0}
+        for tile in moved_goal:
+            if tile:
+                labels[tile] = len(labels)
+        code = 0
+        for cell, tile in enumerate(moved_initial):
+            code |= labels[tile] << (cell * bits)
+        key = (width, permutation[goal.blank], code)
+        if best is None or key < best[0]:
+            best = (key, index)
+    return best
+
+
+class SolveCache:
+    """Solve through an LRU cache, optionally backed by a SQLite file.
+
+    ``options`` are passed to ``puzzle.solve`` on a miss. Results from
+    different options never mix, even when they share a file. ``solve``
+    returns ``(path, stats)`` like the solvers; after a cache hit the stats
+    only carry the lookup time.
+    """
+
+    def __init__(self, maxsize=4096, path=None, **options):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.options = options
+        self.namespace = repr(sorted(options.items()))
+        self.hits = self.stored_hits = self.misses = 0
+        self._entries = OrderedDict()
+        self._store = None
+        if path is not None:
+            self._store = sqlite3.connect(path, timeout=30)
+            with self._store:
+                self._store.execute(
+                    "CREATE TABLE IF NOT EXISTS solutions "
+                    "(namespace TEXT, key TEXT, moves TEXT, PRIMARY KEY (namespace, key))"
+                )
+
+    def solve(self, initial_state, goal_state):
+        initial, goal = pack(initial_state), pack(goal_state)
+        if initial.width != goal.width:
+            raise ValueError("initial and goal boards differ in size")
+        stats = SearchStats()
+        with stats.measure():
+            key, symmetry = canonical_key(initial, goal)
+            found, moves = self._lookup(key)
+        if found:
+            self.hits += 1
+            if moves is None:
+                return None, stats
+            inverse = _INVERSE_MOVE_MAPS[symmetry]
+            return MovePath(initial, "".join(inverse[move] for move in moves)), stats
+
+        self.misses += 1
+        path, stats = solve(initial_state, goal_state, **self.options)
+        if path is None:
+            moves = None
+        else:
+            forward = _MOVE_MAPS[symmetry]
+            moves = "".join(forward[move] for move in path.moves)
+        self._remember(key, moves)
+        if self._store is not None:
+            with self._store:
+                self._store.execute(
+                    "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)",
+                    (self.namespace, _store_key(key), moves),
+                )
+        return path, stats
+
+    __call__ = solve
+
+    def _lookup(self, key):
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            return True, entries[key]
+        if self._store is None:
+            return False, None
+        row = self._store.execute(
+            "SELECT moves FROM solutions WHERE namespace = ? AND key = ?",
+            (self.namespace, _store_key(key)),
+        ).fetchone()
+        if row is None:
+            return False, None
+        self.stored_hits += 1
+        self._remember(key, row[0])
+        return True, row[0]
+
+    def _remember(self, key, moves):
+        entries = self._entries
+        entries[key] = moves
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def info(self):
+        return CacheInfo(self.hits, self.stored_hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Forget the in-memory entries and reset the counters; the file is kept."""
+        self._entries.clear()
+        self.hits = self.stored_hits = self.misses = 0
+
+    def close(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _store_key(key):
+    width, goal_blank, code = key
+    return f"{width}:{goal_blank}:{code:x}"
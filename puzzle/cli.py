@@ -0,0 +1,132 @@
+import argparse
+
+from puzzle.frontier import FRONTIERS
+from puzzle.heuristics import HEURISTICS
+from puzzle.methods import METHODS, solve
+from puzzle.solvability import is_solvable
+
+
+def print_stats(stats):
+    print(f"Time taken : {stats.wall_time:.6f} seconds")
+    print(f"Nodes removed from the frontier: {stats.nodes_removed}")
+    print(f"Nodes generated: {stats.nodes_generated}, re-opened: {stats.nodes_reopened}")
+    print(f"Peak frontier: {stats.peak_frontier}, peak visited: {stats.peak_visited}")
+    if stats.heuristic_time is None:
+        print(f"Heuristic evaluations: {stats.heuristic_evaluations} (time not measured, see --profile)")
+    else:
+        print(f"Heuristic evaluations: {stats.heuristic_evaluations} ({stats.heuristic_time:.6f} seconds)")
+    if stats.samples:
+        total = sum(stats.samples.values())
+        print("Profile samples:")
+        for name, samples in stats.samples.most_common(5):
+            print(f"  {samples / total:6.1%}  {name}")
+
+
+def get_user_input(message):
+    # The first row fixes the board width: 3 values for the 8-puzzle, 4 for the 15-puzzle.
+    board = [list(map(int, input(f"{message} row 1 (space-separated): ").split()))]
+    for i in range(1, len(board[0])):
+        board.append(list(map(int, input(f"{message} row {i + 1} (space-separated): ").split())))
+    return board
+
+
+def print_solution(solution_path):
+    if solution_path:
+        print("Solution found!")
+        print(f"Moves (blank direction): {solution_path.moves}")
+        boards = solution_path.boards()
+        next(boards)
+        for i, (move, board) in enumerate(zip(solution_path.moves, boards)):
+            print(f"Step {i + 1}: Move {move} {board}")
+    else:
+        print("No solution found.")
+
+
+def solve_once(options):
+    initial_state = get_user_input("Enter values for")
+    goal_state = get_user_input("Enter values for goal")
+
+    if is_solvable(initial_state, goal_state):
+        print("The puzzle is solvable.")
+    else:
+        print("The puzzle is not solvable.")
+
+    solution_path, stats = solve(initial_state, goal_state, **options)
+
+    print_solution(solution_path)
+    print_stats(stats)
+
+
+def run_experiment(options, instances=10):
+    import matplotlib.pyplot as plt
+
+    time_taken_list = []
+    nodes_removed_list = []
+    steps_list = []
+
+    for instance in range(instances):
+        print(f"\nInstance {instance + 1}:")
+
+        initial_state = get_user_input("Enter values for initial")
+        goal_state = get_user_input("Enter values for goal")
+
+        if not is_solvable(initial_state, goal_state):
+            print("The generated puzzle is not solvable. Regenerating...")
+            continue
+
+        solution_path, stats = solve(initial_state, goal_state, **options)
+
+        print_solution(solution_path)
+
+        total_steps = len(solution_path) if solution_path else 0
+
+        print_stats(stats)
+        print(f"Total Steps: {total_steps}")
+
+        # Append results to lists for plotting
+        time_taken_list.append(stats.wall_time)
+        nodes_removed_list.append(stats.nodes_removed)
+        steps_list.append(total_steps)
+
+    # Plotting
+    plt.plot(time_taken_list, 'o-')
+    plt.title('Time Taken')
+    plt.xlabel('Instance')
+    plt.ylabel('Time (seconds)')
+    plt.show()
+
+
+def main(argv=None, heuristic="manhattan"):
+    parser = argparse.ArgumentParser(description="Solve 8-puzzle instances with A*.")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default=heuristic)
+    parser.add_argument("--method", choices=sorted(METHODS), default="astar")
+    parser.add_argument("--frontier", choices=FRONTIERS, default="auto",
+                        help="A* frontier (ignored by other methods)")
+    parser.add_argument("--weight", type=float, default=None,
+                        help="weight on h for astar (weighted A*) or the starting weight for anytime")
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="latency budget in seconds for the anytime method")
+    parser.add_argument("--instances", type=int, default=10,
+                        help="number of experiment instances to read after the first puzzle")
+    parser.add_argument("--beam-width", type=int, default=None,
+                        help="children kept per layer by the beam method")
+    parser.add_argument("--profile", action="store_true",
+                        help="sample the search and report where its time went")
+    args = parser.parse_args(argv)
+
+    options = {"method": args.method, "heuristic": args.heuristic, "profile": args.profile}
+    if args.method == "astar":
+        options["frontier"] = args.frontier
+    if args.weight is not None and args.method in ("astar", "anytime"):
+        options["weight"] = args.weight
+    if args.time_limit is not None and args.method == "anytime":
+        options["time_limit"] = args.time_limit
+    if args.beam_width is not None and args.method == "beam":
+        options["beam_width"] = args.beam_width
+
+    solve_once(options)
+    run_experiment(options, args.instances)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import heapq
+from itertools import count
+
+
+class HeapFrontier:
+    """Binary heap ordered by f, then h, then most recent push."""
+
+    __slots__ = ("heap", "tiebreak")
+
+    def __init__(self):
+        self.heap = []
+        self.tiebreak = count(0, -1)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, f, h, node):
+        heapq.heappush(self.heap, (f, h, next(self.tiebreak), node))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[3]
+
+
+class BucketFrontier:
+    """Bucket queue indexed by integer f, LIFO within a bucket.
+
+    Push and pop are O(1) amortised; only valid when every f is a
+    non-negative integer, as with unit moves and integer heuristics.
+    """
+
+    __slots__ = ("buckets", "lowest", "size")
+
+    def __init__(self):
+        self.buckets = []
+        self.lowest = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, f, h, node):
+        buckets = self.buckets
+        while len(buckets) <= f:
+            buckets.append([])
+        buckets[f].append(node)
+        if f < self.lowest:
+            self.lowest = f
+        self.size += 1
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty frontier")
+        buckets = self.buckets
+        f = self.lowest
+        while not buckets[f]:
+            f += 1
+        self.lowest = f
+        self.size -= 1
+        return buckets[f].pop()
+
+
+FRONTIERS = ("auto", "heap", "bucket")
+
+
+def make_frontier(kind, heuristic, weight=1):
+    """Create a frontier; ``"auto"`` picks buckets when every f is an integer.
+
+    That holds for integer heuristics with an integer ``weight``.
+    """
+    integral = getattr(heuristic, "integral", False) and float(weight).is_integer()
+    if kind == "auto":
+        kind = "bucket" if integral else "heap"
+    if kind == "heap":
+        return HeapFrontier()
+    if kind == "bucket":
+        if not integral:
+            raise ValueError("the bucket frontier needs an integer-valued heuristic and weight")
+        return BucketFrontier()
+    raise ValueError(f"unknown frontier {kind!r}, expected one of {FRONTIERS}")
@@ -0,0 +1,351 @@
+import math
+from bisect import bisect_left
+from functools import lru_cache
+
+from puzzle.state import CANONICAL_GOAL, geometry, tile_cells
+
+# Heuristic factories by name; each takes a packed goal state and returns a
+# heuristic aimed at that goal.
+HEURISTICS = {}
+
+
+def register_heuristic(name):
+    def decorator(factory):
+        HEURISTICS[name] = factory
+        _build_heuristic.cache_clear()
+        return factory
+    return decorator
+
+
+@lru_cache(maxsize=256)
+def _build_heuristic(name, goal):
+    return HEURISTICS[name](goal)
+
+
+def get_heuristic(heuristic, goal=CANONICAL_GOAL):
+    """Resolve a heuristic name (or object, or plain function) for ``goal``.
+
+    Named heuristics are built once per goal and cached.
+    """
+    if isinstance(heuristic, str):
+        if heuristic not in HEURISTICS:
+            raise ValueError(
+                f"unknown heuristic {heuristic!r}, expected one of {sorted(HEURISTICS)}"
+            )
+        return _build_heuristic(heuristic, goal)
+    if not hasattr(heuristic, "update"):
+        heuristic = FunctionHeuristic(heuristic)
+    return heuristic
+
+
+class FunctionHeuristic:
+    """Adapts a plain ``heuristic(state)`` function to the solver interface."""
+
+    __slots__ = ("function",)
+
+    integral = False
+
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, state):
+        return self.function(state)
+
+    def update(self, value, parent, child):
+        return self.function(child)
+
+
+class TileHeuristic:
+    """A heuristic that is a sum of independent per-tile costs.
+
+    ``cost(cell, goal_cell, width)`` is tabulated once per goal, so a full
+    evaluation is one lookup per cell and the value of a child is derived
+    from its parent's in O(1): a move only changes the cell of the tile that
+    slid into the blank.
+    """
+
+    __slots__ = ("table", "integral", "cells", "bits", "mask")
+
+    def __init__(self, cost, goal):
+        width, self.cells, self.bits, self.mask, _ = geometry(goal.width)
+        goal_cells = tile_cells(goal)
+        self.table = tuple(
+            cost(cell, goal_cells[tile], width) if tile else 0
+            for tile in range(self.cells)
+            for cell in range(self.cells)
+        )
+        self.integral = all(isinstance(value, int) for value in self.table)
+
+    def __call__(self, state):
+        code = state.code
+        table, cells, bits, mask = self.table, self.cells, self.bits, self.mask
+        return sum(
+            table[((code >> (cell * bits)) & mask) * cells + cell] for cell in range(cells)
+        )
+
+    def update(self, value, parent, child):
+        # The tile that moved now sits where the parent's blank was.
+        row = ((child.code >> (parent.blank * self.bits)) & self.mask) * self.cells
+        table = self.table
+        return value - table[row + child.blank] + table[row + parent.blank]
+
+
+def _manhattan_cost(cell, goal_cell, width):
+    row, col = divmod(cell, width)
+    target_row, target_col = divmod(goal_cell, width)
+    return abs(row - target_row) + abs(col - target_col)
+
+
+def _euclidean_cost(cell, goal_cell, width):
+    row, col = divmod(cell, width)
+    target_row, target_col = divmod(goal_cell, width)
+    return math.sqrt((row - target_row)**2 + (col - target_col)**2)
+
+
+def _misplaced_tile_cost(cell, goal_cell, width):
+    return int(cell != goal_cell)
+
+
+def _longest_increasing(values):
+    # Patience sorting; lines are at most a few tiles long.
+    tails = []
+    for value in values:
+        index = bisect_left(tails, value)
+        if index == len(tails):
+            tails.append(value)
+        else:
+            tails[index] = value
+    return len(tails)
+
+
+class _LineTables:
+    """Per-row and per-column lookup tables keyed by a line's packed contents.
+
+    A row's key is its slice of the packed code; a column's key packs its
+    cells the same way. Each table maps a key to ``value(tiles, line)``, where
+    ``tiles`` lists the line's tiles in order. Entries are filled on first
+    lookup, so each distinct line content is computed only once per goal.
+    """
+
+    __slots__ = ("value", "width", "bits", "mask", "line_mask", "rows", "cols")
+
+    def __init__(self, goal, value):
+        self.value = value
+        self.width, _, self.bits, self.mask, _ = geometry(goal.width)
+        self.line_mask = (1 << (self.width * self.bits)) - 1
+        self.rows = [{} for _ in range(self.width)]
+        self.cols = [{} for _ in range(self.width)]
+
+    def _tiles(self, key):
+        bits, mask = self.bits, self.mask
+        return [(key >> (index * bits)) & mask for index in range(self.width)]
+
+    def row(self, code, row):
+        key = (code >> (row * self.width * self.bits)) & self.line_mask
+        table = self.rows[row]
+        try:
+            return table[key]
+        except KeyError:
+            table[key] = result = self.value(self._tiles(key), row, False)
+            return result
+
+    def col(self, code, col):
+        width, bits, mask = self.width, self.bits, self.mask
+        key = 0
+        for index in range(width):
+            key |= ((code >> ((index * width + col) * bits)) & mask) << (index * bits)
+        table = self.cols[col]
+        try:
+            return table[key]
+        except KeyError:
+            table[key] = result = self.value(self._tiles(key), col, True)
+            return result
+
+
+class LinearConflictHeuristic:
+    """Manhattan distance plus two moves per tile that must leave its line.
+
+    Tiles that sit in their goal row (or column) but in the wrong order
+    relative to each other cannot all stay in that line: at least
+    ``len(line) - longest increasing run`` of them must step out and back.
+    The conflict count of every row and column is a table lookup, and a move
+    only reorders the two rows (vertical move) or the two columns
+    (horizontal move) it touches, so updates look up just those.
+    """
+
+    __slots__ = ("manhattan", "width", "lines", "goal_rows", "goal_cols")
+
+    integral = True
+
+    def __init__(self, goal):
+        self.manhattan = TileHeuristic(_manhattan_cost, goal)
+        self.width = goal.width
+        goal_cells = tile_cells(goal)
+        self.goal_rows = [cell // self.width for cell in goal_cells]
+        self.goal_cols = [cell % self.width for cell in goal_cells]
+        self.goal_rows[0] = self.goal_cols[0] = None
+        self.lines = _LineTables(goal, self._conflicts)
+
+    def _conflicts(self, tiles, line, is_column):
+        goal_lines, goal_places = (
+            (self.goal_cols, self.goal_rows) if is_column else (self.goal_rows, self.goal_cols)
+        )
+        run = [goal_places[tile] for tile in tiles if goal_lines[tile] == line]
+        return len(run) - _longest_increasing(run)
+
+    def __call__(self, state):
+        code, lines = state.code, self.lines
+        conflicts = sum(lines.row(code, line) + lines.col(code, line) for line in range(self.width))
+        return self.manhattan(state) + 2 * conflicts
+
+    def update(self, value, parent, child):
+        value = self.manhattan.update(value, parent, child)
+        width = self.width
+        if parent.blank // width == child.blank // width:
+            lines = (parent.blank % width, child.blank % width)
+            conflict = self.lines.col
+        else:
+            lines = (parent.blank // width, child.blank // width)
+            conflict = self.lines.row
+        for line in lines:
+            value += 2 * (conflict(child.code, line) - conflict(parent.code, line))
+        return value
+
+
+_WALKING_BITS = 3
+
+
+@lru_cache(maxsize=None)
+def _walking_distances(width, blank_line):
+    """BFS over walking-distance patterns, outwards from the goal pattern.
+
+    A pattern counts, for every row ``i`` and goal row ``j``, the tiles in row
+    ``i`` that belong in row ``j``; the blank sits in the row one tile short.
+    One move carries a tile of any class from a row next to the blank's into
+    the blank's row. The same table serves columns by symmetry. Keys pack each
+    count into ``_WALKING_BITS`` bits at ``i * width + j``.
+    """
+    goal = tuple(
+        tuple((width - (i == blank_line)) if i == j else 0 for j in range(width))
+        for i in range(width)
+    )
+
+    def encode(pattern):
+        return sum(
+            count << (_WALKING_BITS * (i * width + j))
+            for i, row in enumerate(pattern)
+            for j, count in enumerate(row)
+        )
+
+    distances = {encode(goal): 0}
+    layer = [(goal, blank_line)]
+    depth = 0
+    while layer:
+        depth += 1
+        next_layer = []
+        for pattern, blank in layer:
+            for source in (blank - 1, blank + 1):
+                if not 0 <= source < width:
+                    continue
+                for tile_class in range(width):
+                    if not pattern[source][tile_class]:
+                        continue
+                    rows = [list(row) for row in pattern]
+                    rows[source][tile_class] -= 1
+                    rows[blank][tile_class] += 1
+                    moved = tuple(map(tuple, rows))
+                    key = encode(moved)
+                    if key not in distances:
+                        distances[key] = depth
+                        next_layer.append((moved, source))
+        layer = next_layer
+    return distances
+
+
+class WalkingDistanceHeuristic:
+    """Walking distance: vertical plus horizontal pattern distances.
+
+    Each row (or column) contributes its part of the pattern key through a
+    per-line lookup table, and the key's distance is one more lookup in a
+    table built once per board width and goal blank position. Dominates
+    manhattan distance; limited to boards up to 4x4, where the tables stay
+    small (24,964 patterns for the 15-puzzle).
+    """
+
+    __slots__ = ("width", "lines", "goal_rows", "goal_cols", "vertical", "horizontal")
+
+    integral = True
+
+    def __init__(self, goal):
+        width = self.width = goal.width
+        if width > 4:
+            raise ValueError("walking distance is only available for boards up to 4x4")
+        goal_cells = tile_cells(goal)
+        self.goal_rows = [cell // width for cell in goal_cells]
+        self.goal_cols = [cell % width for cell in goal_cells]
+        self.vertical = _walking_distances(width, goal.blank // width)
+        self.horizontal = _walking_distances(width, goal.blank % width)
+        self.lines = _LineTables(goal, self._pattern)
+
+    def _pattern(self, tiles, line, is_column):
+        goal_lines = self.goal_cols if is_column else self.goal_rows
+        offset = line * self.width
+        return sum(
+            1 << (_WALKING_BITS * (offset + goal_lines[tile])) for tile in tiles if tile
+        )
+
+    def _vertical(self, code):
+        row = self.lines.row
+        return self.vertical[sum(row(code, line) for line in range(self.width))]
+
+    def _horizontal(self, code):
+        col = self.lines.col
+        return self.horizontal[sum(col(code, line) for line in range(self.width))]
+
+    def __call__(self, state):
+        return self._vertical(state.code) + self._horizontal(state.code)
+
+    def update(self, value, parent, child):
+        # A horizontal move leaves every row's contents unchanged, and a
+        # vertical move every column's.
+        if parent.blank // self.width == child.blank // self.width:
+            return value - self._horizontal(parent.code) + self._horizontal(child.code)
+        return value - self._vertical(parent.code) + self._vertical(child.code)
+
+
+@register_heuristic("manhattan")
+def manhattan(goal):
+    return TileHeuristic(_manhattan_cost, goal)
+
+
+@register_heuristic("euclidean")
+def euclidean(goal):
+    return TileHeuristic(_euclidean_cost, goal)
+
+
+@register_heuristic("misplaced_tile")
+def misplaced_tile(goal):
+    return TileHeuristic(_misplaced_tile_cost, goal)
+
+
+@register_heuristic("linear_conflict")
+def linear_conflict(goal):
+    return LinearConflictHeuristic(goal)
+
+
+@register_heuristic("walking_distance")
+def walking_distance(goal):
+    return WalkingDistanceHeuristic(goal)
+
+
+@register_heuristic("pdb")
+def pattern_database(goal):
+    # Imported lazily: the database is loaded (or built) on first use.
+    from puzzle.pdb import PatternDatabaseHeuristic, for_goal
+    return PatternDatabaseHeuristic(for_goal(goal))
+
+
+# Heuristics towards the canonical goal (1..8 with the blank last).
+manhattan_distance = get_heuristic("manhattan")
+euclidean_distance_heuristic = get_heuristic("euclidean")
+misplaced_tile_heuristic = get_heuristic("misplaced_tile")
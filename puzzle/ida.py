@@ -0,0 +1,98 @@
+import math
+
+from puzzle.heuristics import get_heuristic
+from puzzle.moves import MovePath, direction
+from puzzle.solvability import is_solvable
+from puzzle.state import PackedState, geometry, pack
+from puzzle.stats import SearchStats
+
+_FOUND = -1
+
+
+def ida_star(initial_state, goal_state, heuristic="manhattan", on_expand=None, profile=False):
+    """Iterative-deepening A*: same results as A*, memory linear in depth.
+
+    The search keeps a single packed board and applies each move in place,
+    undoing it on the way back; the move that would undo the parent's move
+    is never generated. Returns ``(path, stats)`` like ``solve_8_puzzle``;
+    the peak frontier and visited figures are the deepest path searched.
+    """
+    initial, goal = pack(initial_state), pack(goal_state)
+    stats = SearchStats()
+    with stats.measure(profile):
+        if not is_solvable(initial, goal):
+            return None, stats
+        path = _ida(initial, goal, get_heuristic(heuristic, goal), stats, on_expand)
+    return path, stats
+
+
+def _ida(initial, goal, heuristic, stats, on_expand):
+    update = stats.timed(heuristic.update)
+    width, _, bits, mask, neighbor_cells = geometry(initial.width)
+    goal_code = goal.code
+    code = initial.code
+    blanks = []
+    nodes_removed = generated = deepest = 0
+
+    def search(cost, h, bound, blank, previous_blank):
+        nonlocal code, nodes_removed, generated, deepest
+        f = cost + h
+        if f > bound:
+            return f
+        nodes_removed += 1
+        if cost > deepest:
+            deepest = cost
+        if on_expand is not None:
+            on_expand(PackedState(code, blank, width), cost, h)
+        if code == goal_code:
+            return _FOUND
+
+        minimum = float("inf")
+        parent = PackedState(code, blank, width)
+        for target in neighbor_cells[blank]:
+            if target == previous_blank:
+                continue
+            generated += 1
+            shift = target * bits
+            tile = (code >> shift) & mask
+            swap = (tile << shift) | (tile << (blank * bits))
+
+            code ^= swap
+            blanks.append(target)
+            result = search(cost + 1, update(h, parent, PackedState(code, target, width)), bound, target, blank)
+            if result == _FOUND:
+                return _FOUND
+            blanks.pop()
+            code ^= swap
+
+            if result < minimum:
+                minimum = result
+        return minimum
+
+    # Every move costs 1, so the optimal cost is a whole number and bounds
+    # can be rounded up; otherwise a float heuristic creeps up by tiny steps.
+    initial_h = stats.timed(heuristic)(initial)
+    bound = math.ceil(initial_h)
+    path = None
+    while True:
+        result = search(0, initial_h, bound, initial.blank, None)
+        if result == _FOUND:
+            path = _replay(initial, blanks)
+            break
+        if result == float("inf"):
+            break
+        bound = math.ceil(result)
+
+    stats.nodes_generated = generated
+    stats.nodes_expanded = nodes_removed
+    stats.peak_frontier = stats.peak_visited = deepest + 1
+    return path
+
+
+def _replay(initial, blanks):
+    moves = []
+    blank = initial.blank
+    for target in blanks:
+        moves.append(direction(blank, target, initial.width))
+        blank = target
+    return MovePath(initial, "".join(moves))
@@ -0,0 +1,61 @@
+"""Parsing of puzzle instances from text.
+
+Each non-blank line is one instance, either a JSON object::
+
+    {"id": "a1", "initial": "123405786", "goal": [[1, 2, 3], [4, 5, 6], [7, 8, 0]]}
+
+or compact boards separated by whitespace, ``"123405786 123456780"`` (one
+base-36 character per tile, so ``"123456789abcdef0"`` is a 15-puzzle).
+Boards may be compact strings, flat lists or lists of rows; a missing goal
+means the canonical goal of the same size. Blank lines and ``#`` comments
+are skipped.
+"""
+import json
+
+from puzzle.state import board_from_values, canonical_goal, parse_board, unpack
+
+
+def read_board(value):
+    if isinstance(value, str):
+        return parse_board(value)
+    if value and isinstance(value[0], list):
+        value = [tile for row in value for tile in row]
+    return board_from_values(value)
+
+
+def parse_instance(line):
+    """Return ``(id, initial_state, goal_state)``, or ``None`` for a blank line."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        record = json.loads(line)
+        initial = read_board(record["initial"])
+        goal = record.get("goal")
+        goal = read_board(goal) if goal is not None else unpack(canonical_goal(len(initial)))
+        return record.get("id"), initial, goal
+    boards = line.split("#", 1)[0].split()
+    if len(boards) not in (1, 2):
+        raise ValueError(f"expected 'initial [goal]', got {line!r}")
+    initial = parse_board(boards[0])
+    goal = parse_board(boards[1]) if len(boards) == 2 else unpack(canonical_goal(len(initial)))
+    return None, initial, goal
+
+
+def read_instances(lines, source="<input>", errors=False):
+    """Lazily yield ``(id, initial_state, goal_state)`` from an iterable of lines.
+
+    A bad line raises ``ValueError``; with ``errors`` the ``ValueError`` is
+    yielded in the instance's place and reading goes on.
+    """
+    for number, line in enumerate(lines, 1):
+        try:
+            instance = parse_instance(line)
+        except (ValueError, KeyError, TypeError) as error:
+            error = ValueError(f"{source}:{number}: {error}")
+            if not errors:
+                raise error from None
+            yield error
+            continue
+        if instance is not None:
+            yield instance
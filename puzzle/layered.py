@@ -0,0 +1,194 @@
+"""Breadth-first and beam search over whole layers at once.
+
+Each layer is a NumPy array of packed codes (see ``puzzle.vectorized``). It
+is expanded in chunks of at most ``chunk`` boards, which bounds the
+temporary arrays, and deduplicated with ``np.unique`` and sorted lookups
+instead of Python sets. The sliding-puzzle graph is bipartite, every move
+flipping the parity of the blank's cell, so a breadth-first layer can only
+contain states of the layer two steps back or new ones; ``bfs_layers``
+keeps just the previous layer, which is enough to find exact distances.
+
+Both searches work for boards up to 4x4 and return ``(path, stats)`` like
+the other solvers. ``beam_search`` keeps only the ``beam_width`` children
+with the lowest heuristic in each layer, so its paths are not always the
+shortest.
+"""
+import numpy as np
+
+from puzzle.heuristics import get_heuristic
+from puzzle.moves import MOVES, MovePath
+from puzzle.solvability import is_solvable
+from puzzle.state import PackedState, pack
+from puzzle.stats import SearchStats
+from puzzle.vectorized import BatchHeuristic, expand, from_array, from_codes, to_codes
+
+DEFAULT_CHUNK = 1 << 16
+DEFAULT_BEAM_WIDTH = 1024
+
+
+def _contains(sorted_codes, codes):
+    """Mask of the ``codes`` present in the sorted array ``sorted_codes``."""
+    if not len(sorted_codes):
+        return np.zeros(len(codes), dtype=bool)
+    index = np.searchsorted(sorted_codes, codes)
+    index[index == len(sorted_codes)] = 0
+    return sorted_codes[index] == codes
+
+
+def _next_layer(codes, width, exclude, chunk, stats):
+    """Distinct children of ``codes`` not in sorted ``exclude``.
+
+    Returns ``(codes, parents, moves)`` with the codes sorted, each child's
+    index in the input and the move that produced it.
+    """
+    parts = []
+    for start in range(0, len(codes), chunk):
+        children, parents, moves = expand(from_codes(codes[start:start + chunk], width))
+        stats.nodes_generated += len(children)
+        child_codes, first = np.unique(to_codes(children), return_index=True)
+        keep = ~_contains(exclude, child_codes)
+        first = first[keep]
+        parts.append((child_codes[keep], parents[first] + start, moves[first]))
+    stats.nodes_expanded += len(codes)
+    if len(parts) == 1:
+        return parts[0]
+    child_codes, parents, moves = (np.concatenate(part) for part in zip(*parts))
+    child_codes, first = np.unique(child_codes, return_index=True)
+    return child_codes, parents[first], moves[first]
+
+
+def _report(codes, width, cost, on_expand):
+    for state in from_array(from_codes(codes, width)):
+        on_expand(state, cost, 0)
+
+
+def _path(initial, layers, index):
+    moves = []
+    for _, parents, layer_moves in reversed(layers[1:]):
+        moves.append(MOVES[layer_moves[index]])
+        index = parents[index]
+    moves.reverse()
+    return MovePath(initial, "".join(moves))
+
+
+def _check_width(width):
+    if width > 4:
+        raise ValueError("layered searches support boards of up to 4x4")
+
+
+def bfs_layers(start_state, max_depth=None, chunk=DEFAULT_CHUNK):
+    """Yield ``(depth, codes)`` for every breadth-first layer around ``start_state``.
+
+    ``codes`` is the sorted ``uint64`` array of packed states exactly
+    ``depth`` moves away. Only two layers are held at a time.
+    ``start_state`` is a board or a ``PackedState``.
+    """
+    start = start_state if isinstance(start_state, PackedState) else pack(start_state)
+    _check_width(start.width)
+    stats = SearchStats()
+    previous = np.zeros(0, dtype=np.uint64)
+    layer = np.array([start.code], dtype=np.uint64)
+    depth = 0
+    while len(layer):
+        yield depth, layer
+        if max_depth is not None and depth >= max_depth:
+            return
+        next_layer = _next_layer(layer, start.width, previous, chunk, stats)[0]
+        previous, layer = layer, next_layer
+        depth += 1
+
+
+def layered_bfs(initial_state, goal_state, heuristic=None, on_expand=None, profile=False, chunk=DEFAULT_CHUNK):
+    """Breadth-first search by whole layers; ``heuristic`` is accepted and ignored.
+
+    Every layer's codes, parent indices and moves are kept to rebuild the
+    path, at about 17 bytes per state. ``on_expand`` receives ``h=0`` and
+    slows the search down, as it needs every state unpacked.
+    """
+    initial, goal = pack(initial_state), pack(goal_state)
+    _check_width(initial.width)
+    stats = SearchStats()
+    with stats.measure(profile):
+        if not is_solvable(initial, goal):
+            return None, stats
+        layers = [(np.array([initial.code], dtype=np.uint64), None, None)]
+        previous = np.zeros(0, dtype=np.uint64)
+        stored = 1
+        while True:
+            codes = layers[-1][0]
+            if on_expand is not None:
+                _report(codes, initial.width, len(layers) - 1, on_expand)
+            found = np.flatnonzero(codes == np.uint64(goal.code))
+            if len(found):
+                path = _path(initial, layers, found[0])
+                break
+            if not len(codes):
+                path = None
+                break
+            stats.peak_frontier = max(stats.peak_frontier, len(codes))
+            layers.append(_next_layer(codes, initial.width, previous, chunk, stats))
+            previous = codes
+            stored += len(layers[-1][0])
+        stats.peak_visited = stored
+    return path, stats
+
+
+def beam_search(initial_state, goal_state, heuristic="manhattan", beam_width=DEFAULT_BEAM_WIDTH,
+                max_depth=None, on_expand=None, profile=False, chunk=DEFAULT_CHUNK):
+    """Beam search: each layer keeps the ``beam_width`` children with the lowest heuristic.
+
+    Manhattan, euclidean and misplaced_tile are scored in batches; other
+    heuristics fall back to one call per child. States already kept in an
+    earlier layer are never revisited, so the search ends when the beam
+    empties or after ``max_depth`` layers without reaching the goal
+    (returning ``None``).
+    """
+    if beam_width < 1:
+        raise ValueError(f"beam width must be at least 1, got {beam_width}")
+    initial, goal = pack(initial_state), pack(goal_state)
+    _check_width(initial.width)
+    width = initial.width
+    stats = SearchStats()
+    with stats.measure(profile):
+        if not is_solvable(initial, goal):
+            return None, stats
+        score = _scorer(get_heuristic(heuristic, goal), goal, stats)
+        layers = [(np.array([initial.code], dtype=np.uint64), None, None)]
+        visited = layers[0][0]
+        path = None
+        while True:
+            codes = layers[-1][0]
+            if on_expand is not None:
+                _report(codes, width, len(layers) - 1, on_expand)
+            found = np.flatnonzero(codes == np.uint64(goal.code))
+            if len(found):
+                path = _path(initial, layers, found[0])
+                break
+            if not len(codes) or (max_depth is not None and len(layers) - 1 >= max_depth):
+                break
+            stats.peak_frontier = max(stats.peak_frontier, len(codes))
+            child_codes, parents, moves = _next_layer(codes, width, visited, chunk, stats)
+            if len(child_codes) > beam_width:
+                keep = np.argsort(score(child_codes, width), kind="stable")[:beam_width]
+                keep.sort()
+                child_codes, parents, moves = child_codes[keep], parents[keep], moves[keep]
+            layers.append((child_codes, parents, moves))
+            visited = np.union1d(visited, child_codes)
+        stats.peak_visited = len(visited)
+    return path, stats
+
+
+def _scorer(heuristic, goal, stats):
+    try:
+        batch = BatchHeuristic(heuristic, goal)
+    except ValueError:
+        batch = None
+
+    def score(codes, width):
+        stats.heuristic_evaluations += len(codes)
+        states = from_codes(codes, width)
+        if batch is not None:
+            return batch(states)
+        return np.array([heuristic(state) for state in from_array(states)])
+
+    return score
@@ -0,0 +1,46 @@
+from puzzle.anytime import anytime_astar
+from puzzle.bidirectional import bidirectional_astar, bidirectional_bfs
+from puzzle.ida import ida_star
+from puzzle.solver import solve_8_puzzle
+
+
+def table_search(initial_state, goal_state, heuristic=None, on_expand=None, profile=False):
+    # Imported lazily so ``python -m puzzle.table`` runs without a stale copy.
+    from puzzle.table import table_search as search
+    return search(initial_state, goal_state, heuristic, on_expand, profile)
+
+
+def layered_bfs(initial_state, goal_state, heuristic=None, on_expand=None, profile=False, **options):
+    # NumPy is only needed by the layered searches.
+    from puzzle.layered import layered_bfs as search
+    return search(initial_state, goal_state, heuristic, on_expand=on_expand, profile=profile, **options)
+
+
+def beam_search(initial_state, goal_state, heuristic="manhattan", on_expand=None, profile=False, **options):
+    from puzzle.layered import beam_search as search
+    return search(initial_state, goal_state, heuristic, on_expand=on_expand, profile=profile, **options)
+
+
+METHODS = {
+    "astar": solve_8_puzzle,
+    "ida": ida_star,
+    "bidirectional": bidirectional_astar,
+    "bidirectional_bfs": bidirectional_bfs,
+    "table": table_search,
+    "anytime": anytime_astar,
+    "bfs": layered_bfs,
+    "beam": beam_search,
+}
+
+
+def solve(initial_state, goal_state, method="astar", **options):
+    """Solve with the named search method; returns ``(path, stats)``.
+
+    Every method accepts ``heuristic``, ``on_expand`` and ``profile``;
+    ``stats`` is a ``puzzle.stats.SearchStats``.
+    """
+    try:
+        search = METHODS[method]
+    except KeyError:
+        raise ValueError(f"unknown method {method!r}, expected one of {sorted(METHODS)}") from None
+    return search(initial_state, goal_state, **options)
@@ -0,0 +1,110 @@
+"""Solution paths stored as move letters.
+
+A move is named after the direction the blank slides: ``U``, ``D``, ``L`` or
+``R``. A path is the start state plus a string of moves, one character per
+step, so searches only keep a letter per node and boards are rebuilt only
+when a path is rendered.
+"""
+from puzzle.state import format_board, slide, unpack
+
+MOVES = "UDLR"
+
+
+def direction(blank, target, width):
+    """Letter for the blank moving from cell ``blank`` to the adjacent ``target``."""
+    offset = target - blank
+    if offset == -width:
+        return "U"
+    if offset == width:
+        return "D"
+    if offset == -1:
+        return "L"
+    if offset == 1:
+        return "R"
+    raise ValueError(f"cells {blank} and {target} are not adjacent")
+
+
+def target_cell(blank, move, width):
+    """Cell the blank slides to for ``move``; raises ValueError if it leaves the board."""
+    row, col = divmod(blank, width)
+    if move == "U" and row > 0:
+        return blank - width
+    if move == "D" and row < width - 1:
+        return blank + width
+    if move == "L" and col > 0:
+        return blank - 1
+    if move == "R" and col < width - 1:
+        return blank + 1
+    if move not in MOVES:
+        raise ValueError(f"unknown move {move!r}, expected one of {MOVES}")
+    raise ValueError(f"move {move} takes the blank off the board from cell {blank}")
+
+
+def apply_moves(state, moves):
+    """Packed state reached from ``state`` by playing the move string ``moves``."""
+    for move in moves:
+        state = slide(state, target_cell(state.blank, move, state.width))
+    return state
+
+
+class MovePath:
+    """A solution: start state and move string, rendered to boards on demand.
+
+    Iterating yields ``(board, next_board)`` pairs of lists of rows, as paths
+    used to be returned; ``moves`` (or ``str(path)``) is the compact form.
+    """
+    __slots__ = ("start", "moves")
+
+    def __init__(self, start, moves=""):
+        self.start = start
+        self.moves = moves
+
+    @classmethod
+    def from_states(cls, states):
+        """Path through consecutive packed ``states``, the first being the start."""
+        width = states[0].width
+        moves = "".join(direction(a.blank, b.blank, width) for a, b in zip(states, states[1:]))
+        return cls(states[0], moves)
+
+    def states(self):
+        """Packed states along the path, start and end included."""
+        state = self.start
+        width = state.width
+        yield state
+        for move in self.moves:
+            state = slide(state, target_cell(state.blank, move, width))
+            yield state
+
+    def boards(self):
+        """Boards along the path as lists of rows, start and end included."""
+        return map(unpack, self.states())
+
+    def compact_boards(self):
+        return [format_board(board) for board in self.boards()]
+
+    def __len__(self):
+        return len(self.moves)
+
+    def __iter__(self):
+        boards = self.boards()
+        board = next(boards)
+        for next_board in boards:
+            yield board, next_board
+            board = next_board
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, MovePath):
+            return self.start == other.start and self.moves == other.moves
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.start, self.moves))
+
+    def __str__(self):
+        return self.moves
+
+    def __repr__(self):
+        return f"MovePath({format_board(unpack(self.start))!r}, {self.moves!r})"
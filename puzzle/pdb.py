@@ -0,0 +1,238 @@
+"""Additive (disjoint) pattern database heuristic for the 8-puzzle.
+
+The eight tiles are split into two groups by their goal cell. For each group
+a table holds the exact number of moves of that group's tiles needed to bring
+them to their goal cells, ignoring every other tile; moves of other tiles cost
+nothing, so the two tables can be added and remain admissible.
+
+Tables are produced by a retrograde 0-1 BFS from the goal. The canonical
+goal's tables, and any generated explicitly, are written to a small binary
+file per goal and memory-mapped on load; other goals are built in memory.
+Stored files are managed with::
+
+    python -m puzzle.pdb generate --goal 123456780
+    python -m puzzle.pdb verify --goal 123456780
+"""
+import mmap
+import os
+import struct
+import sys
+from collections import deque
+
+from puzzle import storage
+from puzzle.state import BITS, CANONICAL_GOAL, CELLS, MASK, NEIGHBOR_CELLS, tile_cells
+
+MAGIC = b"PDB8"
+VERSION = 1
+UNREACHED = 0xFF
+_HEADER = struct.Struct("<4sBBQ")
+
+
+def default_directory():
+    return storage.default_directory("PUZZLE_PDB_DIR", "pdb")
+
+
+def default_path(goal, directory=None):
+    return storage.goal_path(goal, directory or default_directory(), "pdb")
+
+
+def goal_groups(goal):
+    """Split the goal's tiles into two groups by the order of their goal cells."""
+    tiles = [tile for tile in unpack_flat(goal.code) if tile]
+    half = len(tiles) // 2
+    return tuple(tiles[:half]), tuple(tiles[half:])
+
+
+def unpack_flat(code):
+    return [(code >> (cell * BITS)) & MASK for cell in range(CELLS)]
+
+
+def _index(cells):
+    index = 0
+    for cell in reversed(cells):
+        index = index * CELLS + cell
+    return index
+
+
+def build_table(goal, tiles):
+    """Retrograde 0-1 BFS over (group tile cells, blank cell) from the goal."""
+    goal_cells = tile_cells(goal)
+    start = tuple(goal_cells[tile] for tile in tiles)
+    table = bytearray([UNREACHED]) * (CELLS ** len(tiles))
+    distances = {}
+    queue = deque()
+    for blank in range(CELLS):
+        if blank not in start:
+            distances[(start, blank)] = 0
+            queue.append((start, blank, 0))
+
+    while queue:
+        cells, blank, distance = queue.popleft()
+        if distances[(cells, blank)] < distance:
+            continue
+        index = _index(cells)
+        if distance < table[index]:
+            table[index] = distance
+        for target in NEIGHBOR_CELLS[blank]:
+            if target in cells:
+                moved = cells.index(target)
+                next_cells = cells[:moved] + (blank,) + cells[moved + 1:]
+                next_distance = distance + 1
+            else:
+                next_cells = cells
+                next_distance = distance
+            key = (next_cells, target)
+            if next_distance < distances.get(key, UNREACHED):
+                distances[key] = next_distance
+                if next_distance == distance:
+                    queue.appendleft((next_cells, target, next_distance))
+                else:
+                    queue.append((next_cells, target, next_distance))
+    return table
+
+
+def encode(goal):
+    """The database file contents for ``goal``."""
+    groups = goal_groups(goal)
+    parts = [_HEADER.pack(MAGIC, VERSION, len(groups), goal.code)]
+    for tiles in groups:
+        parts.append(bytes([len(tiles), *tiles]))
+    for tiles in groups:
+        parts.append(build_table(goal, tiles))
+    return b"".join(parts)
+
+
+def generate(goal, path=None):
+    return storage.write_atomic(path or default_path(goal), encode(goal))
+
+
+class PatternDatabase:
+    """Tables read from a buffer in the format written by ``generate``.
+
+    ``PatternDatabase(path)`` memory-maps a file; ``build`` holds a fresh
+    build in memory.
+    """
+
+    def __init__(self, path, buffer=None):
+        if buffer is None:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._map = buffer
+        magic, version, group_count, goal_code = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} pattern database")
+        self.goal_code = goal_code
+        self.groups = []
+        offset = _HEADER.size
+        for _ in range(group_count):
+            size = self._map[offset]
+            self.groups.append(tuple(self._map[offset + 1:offset + 1 + size]))
+            offset += 1 + size
+        self.tables = []
+        for tiles in self.groups:
+            length = CELLS ** len(tiles)
+            if offset + length > len(self._map):
+                raise ValueError(f"{path} is truncated")
+            self.tables.append(memoryview(self._map)[offset:offset + length])
+            offset += length
+
+    @classmethod
+    def build(cls, goal):
+        return cls("<memory>", encode(goal))
+
+
+def load(goal, path=None, create=True):
+    if goal.width != 3:
+        raise ValueError("pattern databases are only available for the 8-puzzle")
+    path = path or default_path(goal)
+    if create and not os.path.exists(path):
+        generate(goal, path)
+    database = PatternDatabase(path)
+    if database.goal_code != goal.code:
+        raise ValueError(f"{path} was generated for a different goal")
+    return database
+
+
+def for_goal(goal):
+    """Database for the ``pdb`` heuristic.
+
+    A stored file is used when there is one, and the canonical goal's is
+    generated and stored on first use. Other goals, such as the backward
+    goals of bidirectional search, are built in memory and not saved;
+    ``python -m puzzle.pdb generate --goal ...`` stores one explicitly.
+    """
+    if goal.width != 3:
+        raise ValueError("pattern databases are only available for the 8-puzzle")
+    if goal == CANONICAL_GOAL or os.path.exists(default_path(goal)):
+        return load(goal)
+    return PatternDatabase.build(goal)
+
+
+class PatternDatabaseHeuristic:
+    """Sum of the disjoint pattern costs; a move touches one group only."""
+
+    __slots__ = ("database", "group_of", "weight_of", "tables")
+
+    integral = True
+
+    def __init__(self, database):
+        self.database = database
+        self.tables = database.tables
+        # For every tile: which group it belongs to and its place value in
+        # that group's table index.
+        self.group_of = [None] * CELLS
+        self.weight_of = [0] * CELLS
+        for group, tiles in enumerate(database.groups):
+            for place, tile in enumerate(tiles):
+                self.group_of[tile] = group
+                self.weight_of[tile] = CELLS ** place
+
+    def _group_index(self, cells, group):
+        return _index([cells[tile] for tile in self.database.groups[group]])
+
+    def __call__(self, state):
+        cells = tile_cells(state)
+        return sum(
+            table[self._group_index(cells, group)] for group, table in enumerate(self.tables)
+        )
+
+    def update(self, value, parent, child):
+        tile = (child.code >> (parent.blank * BITS)) & MASK
+        group = self.group_of[tile]
+        table = self.tables[group]
+        index = self._group_index(tile_cells(child), group)
+        # In the parent the moved tile sat where the child's blank is.
+        parent_index = index + (child.blank - parent.blank) * self.weight_of[tile]
+        return value - table[parent_index] + table[index]
+
+
+def verify(goal, path=None):
+    """Return a list of problems with the stored database for ``goal``."""
+    path = path or default_path(goal)
+    if not os.path.exists(path):
+        return [f"{path} does not exist"]
+    try:
+        database = PatternDatabase(path)
+    except ValueError as error:
+        return [str(error)]
+    problems = []
+    if database.goal_code != goal.code:
+        problems.append(f"{path} was generated for a different goal")
+    if tuple(database.groups) != goal_groups(goal):
+        problems.append(f"{path} has unexpected tile groups {database.groups}")
+    else:
+        for tiles, table in zip(database.groups, database.tables):
+            if bytes(table) != bytes(build_table(goal, tiles)):
+                problems.append(f"table for tiles {tiles} does not match a fresh build")
+    return problems
+
+
+def main(argv=None):
+    return storage.main(
+        argv, "Generate or verify 8-puzzle pattern databases.",
+        "pattern database", "PUZZLE_PDB_DIR", generate, verify,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+from puzzle.state import PackedState, geometry, pack
+
+
+def _packed(state):
+    return state if isinstance(state, PackedState) else pack(state)
+
+
+def count_inversions(state):
+    """Number of tile pairs (blank excluded) that appear in decreasing order."""
+    state = _packed(state)
+    _, cells, bits, mask, _ = geometry(state.width)
+    code = state.code
+    seen = 0
+    inversions = 0
+    for cell in range(cells):
+        value = (code >> (cell * bits)) & mask
+        if value:
+            # Tiles already seen that are larger than this one.
+            inversions += (seen >> value).bit_count()
+            seen |= 1 << value
+    return inversions
+
+
+def permutation_parity(state):
+    """Parity that no move can change.
+
+    On odd widths every move keeps the inversion parity. On even widths a
+    vertical move jumps a tile over an odd number of others, flipping the
+    inversion parity while the blank changes row, so inversions plus the
+    blank's row is what stays fixed.
+    """
+    state = _packed(state)
+    parity = count_inversions(state)
+    if state.width % 2 == 0:
+        parity += state.blank // state.width
+    return parity & 1
+
+
+def is_solvable(initial_state, goal_state):
+    """Whether ``goal_state`` is reachable from ``initial_state``.
+
+    The states sharing a ``permutation_parity`` form one connected class, so
+    the pair is solvable exactly when both parities match. Accepts boards or
+    packed states of the same size.
+    """
+    initial, goal = _packed(initial_state), _packed(goal_state)
+    if initial.width != goal.width:
+        raise ValueError(f"boards differ in size: {initial.width}x{initial.width} and {goal.width}x{goal.width}")
+    return permutation_parity(initial) == permutation_parity(goal)
@@ -0,0 +1,123 @@
+from puzzle.frontier import make_frontier
+from puzzle.heuristics import get_heuristic
+from puzzle.moves import MovePath, direction
+from puzzle.solvability import is_solvable
+from puzzle.state import neighbors, pack
+from puzzle.stats import SearchStats
+
+
+class PuzzleNode:
+    __slots__ = ("state", "parent", "move", "cost", "heuristic")
+
+    def __init__(self, state, parent=None, move=None, cost=0, heuristic=0):
+        self.state = state
+        self.parent = parent
+        self.move = move
+        self.cost = cost
+        self.heuristic = heuristic
+
+
+def get_neighbors(node):
+    return neighbors(node.state)
+
+
+def solve_8_puzzle(initial_state, goal_state, heuristic="manhattan", frontier="auto", weight=1,
+                   on_expand=None, profile=False):
+    """A* from ``initial_state`` to ``goal_state`` (square lists of rows, 0 is the blank).
+
+    Despite the name any board size works, e.g. 4x4 for the 15-puzzle.
+
+    ``frontier`` is ``"heap"``, ``"bucket"`` (integer heuristics only) or
+    ``"auto"`` to use buckets whenever the heuristic allows it.
+
+    ``weight`` > 1 runs weighted A* with f = g + weight * h: fewer expansions,
+    and a path at most ``weight`` times longer than optimal for an
+    admissible heuristic.
+
+    ``on_expand(state, cost, h)`` is called with each packed state as it is
+    expanded, and ``profile`` samples the search (see ``puzzle.stats``).
+
+    Returns ``(path, stats)`` where ``path`` is a ``MovePath`` (a move string
+    such as ``"ULDR"``, iterable as ``(board, next_board)`` pairs), or
+    ``None`` if the goal is unreachable, and ``stats`` is a ``SearchStats``.
+    Unsolvable pairs are rejected by a parity check before any search.
+    """
+    if weight < 1:
+        raise ValueError(f"weight must be at least 1, got {weight}")
+    if float(weight).is_integer():
+        weight = int(weight)
+    initial, goal = pack(initial_state), pack(goal_state)
+    stats = SearchStats()
+    with stats.measure(profile):
+        if not is_solvable(initial, goal):
+            return None, stats
+        path = _astar(initial, goal, get_heuristic(heuristic, goal), frontier, weight, stats, on_expand)
+    return path, stats
+
+
+def _astar(initial, goal, heuristic, frontier, weight, stats, on_expand):
+    initial_h = stats.timed(heuristic)(initial)
+    initial_node = PuzzleNode(state=initial, heuristic=initial_h)
+    priority_queue = make_frontier(frontier, heuristic, weight)
+    priority_queue.push(weight * initial_h, initial_h, initial_node)
+    # Cheapest known cost to reach each state. Frontier entries whose cost is
+    # above it were superseded by a cheaper copy and are skipped when popped.
+    best_costs = {initial.code: 0}
+    expanded = set()
+    generated = reopened = peak_frontier = 0
+    update_heuristic = stats.timed(heuristic.update)
+    pop, push = priority_queue.pop, priority_queue.push
+    width = initial.width
+    path = None
+
+    while priority_queue:
+        if len(priority_queue) > peak_frontier:
+            peak_frontier = len(priority_queue)
+        current_node = pop()
+        current_state = current_node.state
+        code = current_state.code
+        if current_node.cost > best_costs[code]:
+            continue
+        if code in expanded:
+            reopened += 1
+        else:
+            expanded.add(code)
+        if on_expand is not None:
+            on_expand(current_state, current_node.cost, current_node.heuristic)
+
+        if current_state == goal:
+            path = reconstruct_path(current_node)
+            break
+
+        cost = current_node.cost + 1
+        current_h = current_node.heuristic
+        children = get_neighbors(current_node)
+        generated += len(children)
+        for neighbor_state in children:
+            if cost >= best_costs.get(neighbor_state.code, cost + 1):
+                continue
+            best_costs[neighbor_state.code] = cost
+            h = update_heuristic(current_h, current_state, neighbor_state)
+            push(cost + weight * h, h, PuzzleNode(
+                state=neighbor_state,
+                parent=current_node,
+                move=direction(current_state.blank, neighbor_state.blank, width),
+                cost=cost,
+                heuristic=h,
+            ))
+
+    stats.nodes_generated = generated
+    stats.nodes_expanded = len(expanded) + reopened
+    stats.nodes_reopened = reopened
+    stats.peak_frontier = peak_frontier
+    stats.peak_visited = len(best_costs)
+    return path
+
+
+def reconstruct_path(node):
+    moves = []
+    while node.parent is not None:
+        moves.append(node.move)
+        node = node.parent
+    moves.reverse()
+    return MovePath(node.state, "".join(moves))
@@ -0,0 +1,173 @@
+"""Compact sliding-puzzle states.
+
+A board of width ``w`` is packed into a single integer with ``bits`` bits per
+cell (4 for boards up to 4x4, so an 8-puzzle takes 36 bits and a 15-puzzle
+64); cell ``r * w + c`` lives at bits ``bits * (r * w + c)``. The blank's
+cell index and the board width are carried next to it so moves never have to
+search for the empty square.
+"""
+from collections import namedtuple
+from math import isqrt
+
+# Layout of the 8-puzzle, which most of the package is about.
+WIDTH = 3
+CELLS = WIDTH * WIDTH
+BITS = 4
+MASK = (1 << BITS) - 1
+
+# Compact boards use one character per tile.
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+class Geometry(namedtuple("Geometry", "width cells bits mask neighbor_cells")):
+    __slots__ = ()
+
+
+_GEOMETRIES = {}
+
+
+def geometry(width):
+    """Board layout for ``width`` x ``width`` puzzles, built once per width."""
+    try:
+        return _GEOMETRIES[width]
+    except KeyError:
+        pass
+    if width < 2:
+        raise ValueError(f"board width must be at least 2, got {width}")
+    cells = width * width
+    bits = max(4, (cells - 1).bit_length())
+    # Cells the blank can slide to from each cell.
+    neighbor_cells = tuple(
+        tuple(
+            r * width + c
+            for r, c in ((row, col + 1), (row + 1, col), (row, col - 1), (row - 1, col))
+            if 0 <= r < width and 0 <= c < width
+        )
+        for row, col in (divmod(cell, width) for cell in range(cells))
+    )
+    _GEOMETRIES[width] = Geometry(width, cells, bits, (1 << bits) - 1, neighbor_cells)
+    return _GEOMETRIES[width]
+
+
+NEIGHBOR_CELLS = geometry(WIDTH).neighbor_cells
+
+
+class PackedState(namedtuple("PackedState", "code blank width", defaults=(WIDTH,))):
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, PackedState):
+            return self.code == other.code
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, PackedState):
+            return self.code != other.code
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.code)
+
+
+def pack(board):
+    width = len(board)
+    bits = geometry(width).bits
+    code = 0
+    blank = None
+    for cell, value in enumerate(value for row in board for value in row):
+        if value == 0:
+            blank = cell
+        code |= value << (cell * bits)
+    if blank is None:
+        raise ValueError("board has no blank (0) tile")
+    return PackedState(code, blank, width)
+
+
+def board_from_values(values):
+    """Reshape a flat permutation of ``0..n*n-1`` into rows."""
+    width = isqrt(len(values))
+    if width < 2 or width * width != len(values) or sorted(values) != list(range(len(values))):
+        raise ValueError(f"{values!r} is not a permutation of 0..n*n-1 for a square board")
+    return [list(values[row * width:(row + 1) * width]) for row in range(width)]
+
+
+def parse_board(text):
+    """Parse a compact board such as ``"123456780"`` or ``"123456789abcdef0"``.
+
+    Boards written with separators (``"1 2 3 ..."``, ``"1,2,3,..."``) are read
+    as numbers; otherwise every character is one tile in base 36.
+    """
+    text = text.strip()
+    try:
+        if any(separator in text for separator in " ,;\t"):
+            values = [int(value) for value in text.replace(",", " ").replace(";", " ").split()]
+        else:
+            values = [int(character, 36) for character in text]
+        return board_from_values(values)
+    except ValueError:
+        raise ValueError(f"{text!r} is not a square board of tiles 0..n*n-1") from None
+
+
+def format_board(board):
+    """Inverse of ``parse_board``: one character per tile, row by row."""
+    values = [tile for row in board for tile in row]
+    if len(values) <= len(_DIGITS):
+        return "".join(_DIGITS[tile] for tile in values)
+    return ",".join(map(str, values))
+
+
+def unpack(state):
+    if isinstance(state, PackedState):
+        code, width = state.code, state.width
+    else:
+        code, width = state, WIDTH
+    _, cells, bits, mask, _ = geometry(width)
+    values = [(code >> (cell * bits)) & mask for cell in range(cells)]
+    return [values[row * width:(row + 1) * width] for row in range(width)]
+
+
+def tile_cells(state):
+    """Cell index of every tile value (index 0 is the blank)."""
+    _, cells, bits, mask, _ = geometry(state.width)
+    code = state.code
+    positions = [0] * cells
+    for cell in range(cells):
+        positions[(code >> (cell * bits)) & mask] = cell
+    return positions
+
+
+def tile_at(state, cell):
+    if isinstance(state, PackedState):
+        bits = geometry(state.width).bits
+        return (state.code >> (cell * bits)) & ((1 << bits) - 1)
+    return (state >> (cell * BITS)) & MASK
+
+
+def slide(state, target):
+    """Move the tile at ``target`` into the blank."""
+    code, blank, width = state
+    _, _, bits, mask, _ = _GEOMETRIES[width]
+    shift = target * bits
+    tile = (code >> shift) & mask
+    return PackedState(code - (tile << shift) + (tile << (blank * bits)), target, width)
+
+
+def neighbors(state):
+    code, blank, width = state
+    _, _, bits, mask, neighbor_cells = _GEOMETRIES[width]
+    blank_shift = blank * bits
+    result = []
+    for target in neighbor_cells[blank]:
+        shift = target * bits
+        tile = (code >> shift) & mask
+        result.append(PackedState(code - (tile << shift) + (tile << blank_shift), target, width))
+    return result
+
+
+def canonical_goal(width=WIDTH):
+    """Goal with tiles ``1..n*n-1`` in order and the blank last."""
+    cells = width * width
+    return pack(board_from_values(list(range(1, cells)) + [0]))
+
+
+CANONICAL_GOAL = canonical_goal()
@@ -0,0 +1,128 @@
+"""Search statistics returned by every solver.
+
+Each solve returns ``(path, stats)`` with a ``SearchStats`` holding node
+counts, peak memory figures, heuristic cost and wall time. Timings use
+``time.perf_counter_ns``. With ``profile=True`` a background thread also
+samples the searching thread's stack every millisecond, so a slow solve
+shows where it spent its time, and every heuristic call is timed (timing
+each call slows a plain search by about a quarter, so it is off otherwise).
+"""
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+SAMPLE_INTERVAL = 0.001
+
+
+class SearchStats:
+    """Counters for one search.
+
+    ``nodes_generated`` counts successor states produced, ``nodes_expanded``
+    states taken off the frontier and expanded (``nodes_removed`` is an alias,
+    the figure the solvers used to return), ``nodes_reopened`` expansions of a
+    state already expanded at a higher cost. ``peak_frontier`` and
+    ``peak_visited`` are the largest frontier and the number of states with a
+    recorded cost (for IDA*, the deepest path). ``heuristic_time_ns`` and
+    ``samples`` (profiler samples by ``module.function``) are only filled in
+    when profiling; otherwise the heuristic time is ``None``, not measured.
+    """
+
+    __slots__ = (
+        "nodes_generated", "nodes_expanded", "nodes_reopened", "peak_frontier", "peak_visited",
+        "heuristic_evaluations", "heuristic_time_ns", "wall_time_ns", "samples", "_timing",
+    )
+
+    def __init__(self):
+        self.nodes_generated = 0
+        self.nodes_expanded = 0
+        self.nodes_reopened = 0
+        self.peak_frontier = 0
+        self.peak_visited = 0
+        self.heuristic_evaluations = 0
+        self.heuristic_time_ns = None
+        self.wall_time_ns = 0
+        self.samples = Counter()
+        self._timing = False
+
+    @property
+    def nodes_removed(self):
+        return self.nodes_expanded
+
+    @property
+    def wall_time(self):
+        return self.wall_time_ns / 1e9
+
+    @property
+    def heuristic_time(self):
+        return None if self.heuristic_time_ns is None else self.heuristic_time_ns / 1e9
+
+    @contextmanager
+    def measure(self, profile=False):
+        """Add the time spent in the block to ``wall_time_ns``, sampling it if ``profile``."""
+        profiler = _Sampler(threading.get_ident(), self.samples) if profile else None
+        if profiler is not None:
+            profiler.start()
+        self._timing = profile
+        if profile and self.heuristic_time_ns is None:
+            self.heuristic_time_ns = 0
+        start = time.perf_counter_ns()
+        try:
+            yield self
+        finally:
+            self.wall_time_ns += time.perf_counter_ns() - start
+            self._timing = False
+            if profiler is not None:
+                profiler.stop()
+
+    def timed(self, evaluate):
+        """Wrap a heuristic function so its calls are counted, and timed when profiling."""
+        if not self._timing:
+            def counted_evaluate(*args):
+                self.heuristic_evaluations += 1
+                return evaluate(*args)
+
+            return counted_evaluate
+
+        clock = time.perf_counter_ns
+
+        def timed_evaluate(*args):
+            start = clock()
+            value = evaluate(*args)
+            self.heuristic_time_ns += clock() - start
+            self.heuristic_evaluations += 1
+            return value
+
+        return timed_evaluate
+
+    def as_dict(self):
+        record = {name: getattr(self, name) for name in self.__slots__[:-2]}
+        if self.samples:
+            record["samples"] = dict(self.samples.most_common())
+        return record
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+        return f"SearchStats({fields})"
+
+
+class _Sampler(threading.Thread):
+    def __init__(self, thread_id, samples, interval=SAMPLE_INTERVAL):
+        super().__init__(name="puzzle-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.samples = samples
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                code = frame.f_code
+                name = getattr(code, "co_qualname", code.co_name)
+                self.samples[f"{frame.f_globals.get('__name__')}.{name}"] += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
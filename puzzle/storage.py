@@ -0,0 +1,67 @@
+"""Per-goal data files shared by the pattern databases and distance tables.
+
+Files live in a directory under ``~/.cache/puzzle`` that an environment
+variable can override, are named by the goal's packed code and are written
+atomically, so concurrent workers never read a half-written file. ``main``
+is the ``generate``/``verify`` command line of both modules.
+"""
+import argparse
+import os
+import sys
+
+from puzzle.state import CANONICAL_GOAL, pack, parse_board
+
+
+def default_directory(variable, name):
+    """``$variable`` if set, else ``~/.cache/puzzle/<name>``."""
+    return os.environ.get(variable) or os.path.join(os.path.expanduser("~"), ".cache", "puzzle", name)
+
+
+def goal_path(goal, directory, extension):
+    return os.path.join(directory, f"{goal.code:09x}.{extension}")
+
+
+def write_atomic(path, data):
+    """Write ``data`` to ``path`` through a temporary file and a rename."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, path)
+    return path
+
+
+def goal_argument(message):
+    """argparse type for an 8-puzzle goal; ``message`` rejects other sizes."""
+    def parse(text):
+        try:
+            goal = pack(parse_board(text))
+        except ValueError as error:
+            raise argparse.ArgumentTypeError(str(error)) from None
+        if goal.width != 3:
+            raise argparse.ArgumentTypeError(message)
+        return goal
+    return parse
+
+
+def main(argv, description, kind, variable, generate, verify):
+    """``generate``/``verify`` command for the files of ``kind`` (e.g. "table")."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("command", choices=("generate", "verify"))
+    parser.add_argument("--goal", type=goal_argument(f"{kind}s are only available for the 8-puzzle"),
+                        default=CANONICAL_GOAL,
+                        help="goal as 9 digits, row by row, 0 for the blank (default 123456780)")
+    parser.add_argument("--path", help=f"{kind} file (default: per-goal file in ${variable})")
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        print(f"wrote {generate(args.goal, args.path)}")
+        return 0
+
+    problems = verify(args.goal, args.path)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if problems:
+        return 1
+    print("ok")
+    return 0
@@ -0,0 +1,122 @@
+"""Streaming solver: instances in, JSON lines out.
+
+Instances are read lazily from a file or stdin (see ``puzzle.instances`` for
+the accepted formats), solved through ``solve_batch`` and written as one JSON
+object per line as soon as each finishes, so memory use does not grow with
+the input and the command composes with Unix pipes::
+
+    generate-instances | python -m puzzle.stream --workers 4 > results.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+from collections import deque
+
+from puzzle.batch import solve_batch
+from puzzle.heuristics import HEURISTICS
+from puzzle.instances import read_instances
+from puzzle.methods import METHODS
+from puzzle.state import format_board
+
+
+def solve_stream(instances, workers=1, boards=False, stats=False, **options):
+    """Yield a result record (a dict) for each ``(id, initial, goal)`` instance.
+
+    The solution is recorded as a move string (``"moves": "ULDR"``); with
+    ``boards`` every board along the path is listed as well, and with
+    ``stats`` the full ``SearchStats`` of the solve. An instance that is a
+    ``ValueError`` (see ``read_instances(..., errors=True)``) or that the
+    solver rejects gets an ``{"index": ..., "error": ...}`` record instead,
+    and the stream goes on.
+    """
+    instance_ids = {}
+    failures = deque()  # records for bad lines, emitted with the next result
+
+    def pairs():
+        # solve_batch numbers only the pairs it is given.
+        position = 0
+        for index, instance in enumerate(instances):
+            if isinstance(instance, ValueError):
+                failures.append({"index": index, "error": str(instance)})
+                continue
+            instance_id, initial_state, goal_state = instance
+            instance_ids[position] = index, instance_id
+            position += 1
+            yield initial_state, goal_state
+
+    for result in solve_batch(pairs(), workers=workers, **options):
+        while failures:
+            yield failures.popleft()
+        index, instance_id = instance_ids.pop(result.index)
+        record = {"index": index}
+        if instance_id is not None:
+            record["id"] = instance_id
+        if result.error is not None:
+            record["error"] = result.error
+            yield record
+            continue
+        record.update(
+            initial=format_board(result.initial_state),
+            goal=format_board(result.goal_state),
+            solved=result.path is not None,
+            steps=result.steps,
+            nodes_removed=result.nodes_removed,
+            time_taken=round(result.time_taken, 6),
+            moves=None if result.path is None else result.path.moves,
+        )
+        if boards:
+            record["path"] = None if result.path is None else result.path.compact_boards()[1:]
+        if stats:
+            record["stats"] = result.stats.as_dict()
+        yield record
+    yield from failures
+
+
+def write_records(records, output):
+    for record in records:
+        output.write(json.dumps(record, separators=(",", ":")))
+        output.write("\n")
+        output.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a stream of 8-puzzle instances to JSON lines.")
+    parser.add_argument("input", nargs="?", default="-", help="instance file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="result file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--method", choices=sorted(METHODS), default="astar")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="manhattan")
+    parser.add_argument("--cache", help="SQLite file of solutions reused across runs")
+    parser.add_argument("--boards", action="store_true", help="also list every board along each path")
+    parser.add_argument("--stats", action="store_true", help="also record the search statistics")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        instances = read_instances(source, "<stdin>" if args.input == "-" else args.input, errors=True)
+        records = solve_stream(
+            instances, workers=args.workers, boards=args.boards, stats=args.stats, cache=args.cache,
+            method=args.method, heuristic=args.heuristic,
+        )
+        write_records(records, output)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader went away (e.g. ``| head``); send whatever Python still
+        # flushes at exit to /dev/null instead of failing again.
+        if output is sys.stdout:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Exact distance tables over the whole 8-puzzle state space.
+
+One BFS from a goal reaches all 181,440 states of its parity class. The
+distance of every state is stored as one byte at the Lehmer rank of its
+permutation (9! bytes per goal), so an optimal path is found by greedy
+descent: from any state, step to a neighbour one move closer.
+
+Tables are written once per goal and memory-mapped on load::
+
+    python -m puzzle.table generate --goal 123456780
+    python -m puzzle.table verify --goal 123456780
+"""
+import math
+import mmap
+import os
+import struct
+import sys
+from functools import lru_cache
+
+from puzzle import storage
+from puzzle.moves import MovePath
+from puzzle.solvability import is_solvable
+from puzzle.state import BITS, CELLS, MASK, PackedState, neighbors, pack
+from puzzle.stats import SearchStats
+
+MAGIC = b"DST8"
+VERSION = 1
+UNREACHED = 0xFF
+STATES = math.factorial(CELLS)
+_HEADER = struct.Struct("<4sBQ")
+
+
+def default_directory():
+    return storage.default_directory("PUZZLE_TABLE_DIR", "tables")
+
+
+def default_path(goal, directory=None):
+    return storage.goal_path(goal, directory or default_directory(), "dst")
+
+
+def rank(code):
+    """Lehmer rank of the permutation packed in ``code``, in ``range(9!)``."""
+    result = 0
+    seen = 0
+    factor = 1
+    for cell in range(CELLS - 1, -1, -1):
+        value = (code >> (cell * BITS)) & MASK
+        result += (seen & ((1 << value) - 1)).bit_count() * factor
+        seen |= 1 << value
+        factor *= CELLS - cell
+    return result
+
+
+def unrank(index):
+    """Packed 8-puzzle state whose permutation has Lehmer rank ``index``."""
+    remaining = list(range(CELLS))
+    code = blank = 0
+    for cell in range(CELLS):
+        digit, index = divmod(index, math.factorial(CELLS - 1 - cell))
+        value = remaining.pop(digit)
+        if value == 0:
+            blank = cell
+        code |= value << (cell * BITS)
+    return PackedState(code, blank)
+
+
+def build_distances(goal):
+    distances = bytearray([UNREACHED]) * STATES
+    distances[rank(goal.code)] = 0
+    layer = [goal]
+    depth = 0
+    while layer:
+        depth += 1
+        next_layer = []
+        for state in layer:
+            for neighbor_state in neighbors(state):
+                index = rank(neighbor_state.code)
+                if distances[index] == UNREACHED:
+                    distances[index] = depth
+                    next_layer.append(neighbor_state)
+        layer = next_layer
+    return distances
+
+
+def generate(goal, path=None):
+    data = _HEADER.pack(MAGIC, VERSION, goal.code) + build_distances(goal)
+    return storage.write_atomic(path or default_path(goal), data)
+
+
+class DistanceTable:
+    """Memory-mapped distance table for one goal."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, goal_code = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} distance table")
+        if len(self._map) != _HEADER.size + STATES:
+            raise ValueError(f"{path} is truncated")
+        self.goal_code = goal_code
+        self.distances = memoryview(self._map)[_HEADER.size:]
+
+    def distance(self, state):
+        """Optimal number of moves to the goal, or ``None`` if unreachable."""
+        distance = self.distances[rank(state.code)]
+        return None if distance == UNREACHED else distance
+
+    def states_at(self, distance):
+        """Ranks of every state exactly ``distance`` moves from the goal."""
+        return [index for index, value in enumerate(self.distances) if value == distance]
+
+    def path(self, state):
+        """Optimal list of states from ``state`` to the goal, or ``None``."""
+        distances = self.distances
+        distance = distances[rank(state.code)]
+        if distance == UNREACHED:
+            return None
+        states = [state]
+        while distance:
+            distance -= 1
+            state = next(
+                neighbor_state for neighbor_state in neighbors(state)
+                if distances[rank(neighbor_state.code)] == distance
+            )
+            states.append(state)
+        return states
+
+
+@lru_cache(maxsize=16)
+def load(goal, path=None, create=True):
+    path = path or default_path(goal)
+    if create and not os.path.exists(path):
+        generate(goal, path)
+    table = DistanceTable(path)
+    if table.goal_code != goal.code:
+        raise ValueError(f"{path} was generated for a different goal")
+    return table
+
+
+def table_search(initial_state, goal_state, heuristic=None, on_expand=None, profile=False):
+    """Optimal solve by table lookup; ``heuristic`` is accepted and ignored.
+
+    The goal's table is loaded, or built on first use. Returns
+    ``(path, stats)`` like ``solve_8_puzzle``, where the expanded nodes are
+    the states visited on the way down.
+    """
+    initial, goal = pack(initial_state), pack(goal_state)
+    if goal.width != 3:
+        raise ValueError("distance tables are only available for the 8-puzzle")
+    stats = SearchStats()
+    with stats.measure(profile):
+        if not is_solvable(initial, goal):
+            return None, stats
+        states = load(goal).path(initial)
+        if states is None:
+            return None, stats
+        if on_expand is not None:
+            for cost, state in enumerate(states):
+                on_expand(state, cost, len(states) - 1 - cost)
+        stats.nodes_expanded = stats.peak_visited = len(states)
+    return MovePath.from_states(states), stats
+
+
+def verify(goal, path=None):
+    """Return a list of problems with the stored table for ``goal``."""
+    path = path or default_path(goal)
+    if not os.path.exists(path):
+        return [f"{path} does not exist"]
+    try:
+        table = DistanceTable(path)
+    except ValueError as error:
+        return [str(error)]
+    if table.goal_code != goal.code:
+        return [f"{path} was generated for a different goal"]
+    if bytes(table.distances) != bytes(build_distances(goal)):
+        return [f"{path} does not match a fresh build"]
+    return []
+
+
+def main(argv=None):
+    return storage.main(
+        argv, "Generate or verify 8-puzzle distance tables.",
+        "distance table", "PUZZLE_TABLE_DIR", generate, verify,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
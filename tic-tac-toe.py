@@ -1,5 +1,7 @@
 import random
 
+from tictactoe import minimax as search
+
 def print_board(board):
     for row in board:
         print(" ".join(row))
@@ -25,30 +27,9 @@ def available_moves(board):
     return [(i, j) for i in range(3) for j in range(3) if board[i][j] == ' ']
 
 def minimax(board, depth, maximizing_player):
-    winner = check_winner(board)
-    if winner:
-        return 1 if winner == 'X' else -1
-    elif is_board_full(board):
-        return 0
-
-    if maximizing_player:
-        max_eval = float('-inf')
-        for move in available_moves(board):
-            i, j = move
-            board[i][j] = 'X'
-            eval = minimax(board, depth + 1, False)
-            board[i][j] = ' '
-            max_eval = max(max_eval, eval)
-        return max_eval
-    else:
-        min_eval = float('inf')
-        for move in available_moves(board):
-            i, j = move
-            board[i][j] = 'O'
-            eval = minimax(board, depth + 1, True)
-            board[i][j] = ' '
-            min_eval = min(min_eval, eval)
-        return min_eval
+    # Full minimax, with exact values shared across moves and games through
+    # a transposition table.
+    return search(board, maximizing_player, pruning=False)
 
 def best_move(board):
     best_val = float('-inf')
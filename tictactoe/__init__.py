@@ -0,0 +1,14 @@
+from tictactoe.bitboard import from_board, to_board
+from tictactoe.search import best_move, minimax, search
+from tictactoe.transposition import TABLE, TranspositionTable, canonical_key
+
+__all__ = [
+    "TABLE",
+    "TranspositionTable",
+    "best_move",
+    "canonical_key",
+    "from_board",
+    "minimax",
+    "search",
+    "to_board",
+]
@@ -0,0 +1,78 @@
+"""Tic-tac-toe positions as a pair of 9-bit masks.
+
+Bit ``3 * row + col`` of ``x`` (or ``o``) is set when that player has
+marked the cell. A player has won when their mask covers one of the 8
+``LINE_MASKS``, the empty cells are ``FULL & ~(x | o)``, and moves are
+taken from the empty mask lowest bit first, which is row-major order like
+the scripts' loops. Per-mask answers are tabulated once: ``WINNING`` for
+win detection and one permutation table per symmetry of the square for
+canonical keys.
+"""
+FULL = 0x1FF
+
+LINE_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+)
+
+# Cells are numbered row by row; each symmetry lists the source cell of
+# every cell of the transformed board.
+SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),
+)
+
+
+def has_line(mask):
+    """Whether ``mask`` covers a full row, column or diagonal."""
+    for line in LINE_MASKS:
+        if mask & line == line:
+            return True
+    return False
+
+
+def _transform(mask, symmetry):
+    return sum(1 << cell for cell, source in enumerate(symmetry) if mask >> source & 1)
+
+
+WINNING = tuple(has_line(mask) for mask in range(FULL + 1))
+_SYMMETRY_TABLES = tuple(
+    tuple(_transform(mask, symmetry) for mask in range(FULL + 1)) for symmetry in SYMMETRIES
+)
+
+
+def from_board(board):
+    """``(x, o)`` masks of a 3x3 list board of ' '/'X'/'O'."""
+    x = o = 0
+    for i, row in enumerate(board):
+        for j, cell in enumerate(row):
+            if cell == 'X':
+                x |= 1 << (3 * i + j)
+            elif cell == 'O':
+                o |= 1 << (3 * i + j)
+    return x, o
+
+
+def to_board(x, o):
+    """3x3 list board of the masks ``x`` and ``o``."""
+    return [
+        ['X' if x >> (3 * i + j) & 1 else 'O' if o >> (3 * i + j) & 1 else ' ' for j in range(3)]
+        for i in range(3)
+    ]
+
+
+def canonical_key(x, o, maximizing_player):
+    """Key of the position shared by its rotated and mirrored copies.
+
+    The smallest ``x << 9 | o`` over the 8 symmetries, times two plus the
+    side to move.
+    """
+    code = min((table[x] << 9) | table[o] for table in _SYMMETRY_TABLES)
+    return code * 2 + bool(maximizing_player)
@@ -0,0 +1,86 @@
+"""Alpha-beta minimax for tic-tac-toe with a transposition table.
+
+``X`` is the maximizing player. Values are 1 if X wins, -1 if O wins and 0
+for a draw, as in the scripts, and ``nodes_visited[0]`` counts the
+non-terminal positions actually searched, so positions answered by the
+table are not counted. With ``pruning=False`` the search is plain minimax:
+every child is searched with the full window, so the table only ever holds
+and answers exact values. List boards are converted to bitboards once per
+call and the search itself runs on the masks.
+"""
+from tictactoe.bitboard import FULL, WINNING, canonical_key, from_board
+from tictactoe.transposition import TABLE
+
+INFINITY = float('inf')
+
+
+def minimax(board, maximizing_player, nodes_visited=None, alpha=-INFINITY, beta=INFINITY, table=TABLE,
+            pruning=True):
+    """Value of ``board`` with X to move if ``maximizing_player``.
+
+    Fail-soft: a result at or below ``alpha`` is an upper bound and one at or
+    above ``beta`` a lower bound. Without ``pruning`` the window is ignored
+    and the value is exact. ``board`` is left unchanged.
+    """
+    x, o = from_board(board)
+    if not pruning:
+        alpha, beta = -INFINITY, INFINITY
+    return search(x, o, maximizing_player, nodes_visited, alpha, beta, table, pruning)
+
+
+def search(x, o, maximizing_player, nodes_visited=None, alpha=-INFINITY, beta=INFINITY, table=TABLE,
+           pruning=True):
+    """``minimax`` on the bitboards ``x`` and ``o``."""
+    if WINNING[x]:
+        return 1
+    if WINNING[o]:
+        return -1
+    empty = FULL & ~(x | o)
+    if not empty:
+        return 0
+
+    key = canonical_key(x, o, maximizing_player)
+    value = table.probe(key, alpha, beta)
+    if value is not None:
+        return value
+    if nodes_visited is not None:
+        nodes_visited[0] += 1
+
+    low, high = alpha, beta
+    best = -INFINITY if maximizing_player else INFINITY
+    while empty:
+        bit = empty & -empty
+        empty ^= bit
+        if maximizing_player:
+            value = search(x | bit, o, False, nodes_visited, low, high, table, pruning)
+            if value > best:
+                best = value
+                if pruning and value > low:
+                    low = value
+        else:
+            value = search(x, o | bit, True, nodes_visited, low, high, table, pruning)
+            if value < best:
+                best = value
+                if pruning and value < high:
+                    high = value
+        if high <= low:
+            break
+    table.store(key, best, alpha, beta)
+    return best
+
+
+def best_move(board, nodes_visited=None, table=TABLE, pruning=True):
+    """Best cell ``(row, col)`` for X, the first one found among equals."""
+    x, o = from_board(board)
+    empty = FULL & ~(x | o)
+    best_value = -INFINITY
+    move = None
+    while empty:
+        bit = empty & -empty
+        empty ^= bit
+        alpha = best_value if pruning else -INFINITY
+        value = search(x | bit, o, False, nodes_visited, alpha, INFINITY, table, pruning)
+        if value > best_value:
+            best_value = value
+            move = divmod(bit.bit_length() - 1, 3)
+    return move
@@ -0,0 +1,65 @@
+"""Transposition table shared by the tic-tac-toe searches.
+
+Positions are keyed by a canonical hash: the two bitboards are permuted by
+each of the 8 symmetries of the square and the smallest code is kept, so
+rotated and mirrored positions share one entry. The side to move is part
+of the key, since the scripts let either player start.
+
+Entries store a value with a flag saying whether it is exact or only a lower
+or upper bound, as alpha-beta produces bounds whenever it cuts off. Scores
+are +1/0/-1 for the final result regardless of depth, so an entry is valid
+wherever the position occurs. The module-level ``TABLE`` lives as long as
+the process, across moves and games.
+"""
+from tictactoe import bitboard
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def canonical_key(board, maximizing_player):
+    """Hash of ``board`` (3x3 lists of ' '/'X'/'O') shared by its symmetric copies."""
+    return bitboard.canonical_key(*bitboard.from_board(board), maximizing_player)
+
+
+class TranspositionTable:
+    """Search results by position, with exact/lower/upper bound flags."""
+
+    __slots__ = ("entries", "hits", "misses")
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def probe(self, key, alpha, beta):
+        """Stored value if it settles the search in the window, else ``None``."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            flag, value = entry
+            if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def store(self, key, value, alpha, beta):
+        """Record ``value`` searched with the window ``(alpha, beta)``."""
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != EXACT:
+            self.entries[key] = (flag, value)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+
+TABLE = TranspositionTable()